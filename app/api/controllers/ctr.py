@@ -1,4 +1,5 @@
 """Transaction controller for managing application logic."""
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 
@@ -18,6 +19,17 @@ except ImportError:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Reported by validate_transaction_query; read once since settings don't change after startup
+_SCHEMA_ADAPTER_MODE = getattr(settings, "SCHEMA_ADAPTER_MODE", "static")
+
+# Company filter parameter for each relationship type; anything else means any involvement
+_REL_KEY = {
+    "buyer": "buyerId",
+    "seller": "sellerId",
+    "target": "targetId",
+    "acquirer": "acquirerId"
+}
+
 
 class TransactionController:
     """Controller for transaction-related operations."""
@@ -121,13 +133,12 @@ class TransactionController:
                     'has_prev': has_prev
                 }
             }
-        except (QueryBuildError, DatabaseError):
-            # Re-raise specific errors
-            raise
         except Exception as e:
-            # Handle other errors
+            # Re-raise specific errors; wrap anything else
+            if isinstance(e, (QueryBuildError, DatabaseError)):
+                raise
             logger.error(f"Error in paginated transaction service: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Error processing paginated transaction request: {str(e)}")
+            raise DatabaseError(f"Error processing paginated transaction request: {str(e)}") from e
 
     @staticmethod
     async def get_transaction_by_id(transaction_id: int) -> Optional[Dict[str, Any]]:
@@ -147,7 +158,7 @@ class TransactionController:
         params = {"transactionId": str(transaction_id)}
         results = await TransactionController.get_transactions(params)
 
-        if not results or len(results) == 0:
+        if not results:
             return None
 
         return results[0]
@@ -196,22 +207,32 @@ class TransactionController:
         # Create SELECT parameter
         params["select"] = ",".join(select_fields)
 
-        # Execute query
-        results = await TransactionController.get_transactions(params)
+        # Run the transaction query and the related lookups concurrently;
+        # the related lookups only need the transaction ID
+        queries = [TransactionController.get_transactions(params)]
+        if include_companies:
+            queries.append(TransactionService.get_related_companies(transaction_id))
+        if include_advisors:
+            queries.append(TransactionService.get_transaction_advisors(transaction_id))
+
+        outcomes = await asyncio.gather(*queries, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
 
-        if not results or len(results) == 0:
+        results, *related = outcomes
+
+        if not results:
             return {}
 
         # Get the main transaction record
         transaction = results[0]
 
-        # If companies are included, get related companies (target, acquirer, etc.)
+        # Attach related companies (target, acquirer, etc.) and advisors if requested
         if include_companies:
-            transaction['relatedCompanies'] = await TransactionService.get_related_companies(transaction_id)
-
-        # If advisors are included, get advisors
+            transaction['relatedCompanies'] = related.pop(0)
         if include_advisors:
-            transaction['advisors'] = await TransactionService.get_transaction_advisors(transaction_id)
+            transaction['advisors'] = related.pop(0)
 
         return transaction
 
@@ -254,14 +275,14 @@ class TransactionController:
 
         elif analysis_type == "comparison":
             # For comparison, ensure we have category and measure
-            if "groupBy" not in request and mapped_fields and len(mapped_fields) > 0:
+            if "groupBy" not in request and mapped_fields:
                 request["groupBy"] = mapped_fields[0]
             if "select" not in request:
                 request["select"] = "count"
 
         elif analysis_type == "distribution":
             # For distribution, we need to bin values
-            if "select" not in request and mapped_fields and len(mapped_fields) > 0:
+            if "select" not in request and mapped_fields:
                 request["select"] = mapped_fields[0]
 
         # Process special parameters
@@ -290,7 +311,7 @@ class TransactionController:
             try:
                 schema_info = {
                     "tables_count": len(schema_service.tables) if hasattr(schema_service, "tables") else 0,
-                    "adapter_mode": getattr(settings, "SCHEMA_ADAPTER_MODE", "static"),
+                    "adapter_mode": _SCHEMA_ADAPTER_MODE,
                 }
                 validation_info["schema_info"] = schema_info
             except Exception as e:
@@ -315,19 +336,7 @@ class TransactionController:
             List of related transactions
         """
         # Set up parameters based on relationship type
-        params = {}
-
-        if relationship_type == "buyer":
-            params["buyerId"] = str(company_id)
-        elif relationship_type == "seller":
-            params["sellerId"] = str(company_id)
-        elif relationship_type == "target":
-            params["targetId"] = str(company_id)
-        elif relationship_type == "acquirer":
-            params["acquirerId"] = str(company_id)
-        else:
-            # Default to any involvement
-            params["involvedCompanyId"] = str(company_id)
+        params = {_REL_KEY.get(relationship_type, "involvedCompanyId"): str(company_id)}
 
         # Add select fields for detailed information if requested
         if include_details:
@@ -1,6 +1,8 @@
 """Transaction controller for managing application logic."""
+import asyncio
+import base64
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, AsyncIterator, Mapping, Optional, Union
 
 from app.services.transaction_service import TransactionService
 from app.utils.errors import QueryBuildError, DatabaseError, SchemaCompatibilityError
@@ -18,32 +20,110 @@ except ImportError:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Reported by validate_transaction_query; read once since settings don't change after startup
+_SCHEMA_ADAPTER_MODE = getattr(settings, "SCHEMA_ADAPTER_MODE", "static")
+
+# Ordering that keyset (cursor) pagination is defined over. transactionId is
+# used instead of (announced date, transactionId): the announced date is split
+# over nullable year/month/day columns, and a composite keyset predicate needs
+# an OR of comparisons, which query parameters (ANDed filters) can't express.
+# transactionId is unique, so the order is total and pages never skip or
+# repeat rows.
+CURSOR_ORDER_BY = "transactionId:desc"
+
+# Window column that returns the unpaginated total alongside each row.
+# Snowflake upper-cases unquoted aliases, so the column is matched case-insensitively.
+TOTAL_COUNT_COLUMN = "total_count"
+TOTAL_COUNT_SELECT = f"COUNT(*) OVER () AS {TOTAL_COUNT_COLUMN}"
+
+
+def _is_total_column(name: Any) -> bool:
+    return isinstance(name, str) and name.lower() == TOTAL_COUNT_COLUMN
+
+
+def _pop_total_column(results: Union[List[Dict[str, Any]], Dict[str, Any]]) -> Optional[int]:
+    """Remove the window total from a result and return it (None when it can't be read)."""
+    if isinstance(results, list):
+        total_count = None
+        for row in results:
+            for key in [key for key in row if _is_total_column(key)]:
+                total_count = row.pop(key)
+        return total_count
+
+    # Columnar result: drop the column and its value from every row
+    columns = results['columns']
+    index = next((i for i, name in enumerate(columns) if _is_total_column(name)), None)
+    if index is None:
+        return None
+    rows = results['rows']
+    total_count = rows[0][index] if rows else None
+    del columns[index]
+    results['rows'] = [row[:index] + row[index + 1:] for row in rows]
+    return total_count
+
 
 class TransactionController:
     """Controller for transaction-related operations."""
 
     @staticmethod
-    async def get_transactions(params: Dict[str, str]) -> List[Dict[str, Any]]:
+    async def get_transactions(
+            params: Mapping[str, str],
+            columnar: bool = False
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Get transactions based on parameters.
 
         Args:
-            params: Dictionary of query parameters
+            params: Mapping of query parameters (not modified)
+            columnar: Return {"columns": [...], "rows": [...]} instead of one dict per record
+
+        Returns:
+            List of transaction records, or the columnar result
+
+        Raises:
+            QueryBuildError: If there's an error building the query
+            DatabaseError: If there's an error executing the query
+        """
+        return await TransactionService.execute_transaction_query(params, columnar=columnar)
+
+    @staticmethod
+    def stream_transactions(params: Mapping[str, str]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream transactions based on parameters, in batches of records.
+
+        Args:
+            params: Mapping of query parameters (not modified)
 
         Returns:
-            List of transaction records
+            Async iterator over lists of transaction records; query errors are
+            raised when the first batch is awaited
 
         Raises:
             QueryBuildError: If there's an error building the query
             DatabaseError: If there's an error executing the query
         """
-        return await TransactionService.execute_transaction_query(params)
+        return TransactionService.stream_transaction_query(params)
 
     @staticmethod
-    async def count_transactions(params: Dict[str, str]) -> int:
+    def stream_transactions_by_company(
+            company_id: int,
+            relationship_type: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream a company's transactions in batches of records.
+
+        Args:
+            company_id: Company ID
+            relationship_type: Optional relationship type (buyer, seller, target)
+
+        Returns:
+            Async iterator over lists of transaction records
+        """
+        return TransactionService.stream_transactions_by_company(company_id, relationship_type)
+
+    @staticmethod
+    async def count_transactions(params: Mapping[str, str]) -> int:
         """Count transactions based on parameters.
 
         Args:
-            params: Dictionary of query parameters
+            params: Mapping of query parameters (not modified)
 
         Returns:
             Number of matching transactions
@@ -56,16 +136,24 @@ class TransactionController:
 
     @staticmethod
     async def get_transactions_with_pagination(
-            params: Dict[str, str],
+            params: Mapping[str, str],
             page: int = 1,
-            page_size: Optional[int] = None
+            page_size: Optional[int] = None,
+            with_total: bool = True,
+            columnar: bool = False
     ) -> Dict[str, Any]:
         """Get transactions with pagination.
 
+        When the request has an explicit select, the total is computed in the
+        same query with a COUNT(*) OVER () window column instead of a separate
+        count query.
+
         Args:
-            params: Dictionary of query parameters
+            params: Mapping of query parameters (not modified)
             page: Page number (1-based)
             page_size: Number of records per page (defaults to settings.DEFAULT_LIMIT)
+            with_total: Compute the total in the list query when possible
+            columnar: Return the records as {"columns": [...], "rows": [...]}
 
         Returns:
             Dictionary with pagination info and transaction records
@@ -83,16 +171,36 @@ class TransactionController:
             page = 1
 
         # Apply pagination parameters
-        pagination_params = params.copy()
+        pagination_params = dict(params)
         pagination_params['limit'] = str(page_size)
         pagination_params['offset'] = str((page - 1) * page_size)
 
-        try:
-            # Get total count (without pagination)
-            total_count = await TransactionController.count_transactions(params)
+        # The window total can only be added to an explicit projection
+        inline_total = with_total and bool(pagination_params.get('select'))
+        if inline_total:
+            pagination_params['select'] = f"{pagination_params['select']},{TOTAL_COUNT_SELECT}"
 
-            # Get paginated results
-            results = await TransactionController.get_transactions(pagination_params)
+        try:
+            if inline_total:
+                results = await TransactionController.get_transactions(pagination_params, columnar)
+
+                # Every row carries the same total; strip it before returning the rows
+                total_count = _pop_total_column(results)
+
+                # Fall back to a count query when the total couldn't be read from
+                # the rows; only an empty first page is known to have no matches
+                if total_count is None:
+                    has_rows = bool(results['rows'] if isinstance(results, dict) else results)
+                    if has_rows or page > 1:
+                        total_count = await TransactionController.count_transactions(params)
+                    else:
+                        total_count = 0
+            else:
+                # Get total count (without pagination)
+                total_count = await TransactionController.count_transactions(params)
+
+                # Get paginated results
+                results = await TransactionController.get_transactions(pagination_params, columnar)
 
             # Calculate pagination info
             total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
@@ -110,13 +218,113 @@ class TransactionController:
                     'has_prev': has_prev
                 }
             }
-        except (QueryBuildError, DatabaseError):
-            # Re-raise specific errors
-            raise
         except Exception as e:
-            # Handle other errors
+            # Re-raise specific errors; wrap anything else
+            if isinstance(e, (QueryBuildError, DatabaseError)):
+                raise
             logger.error(f"Error in paginated transaction service: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Error processing paginated transaction request: {str(e)}")
+            raise DatabaseError(f"Error processing paginated transaction request: {str(e)}") from e
+
+    @staticmethod
+    def encode_cursor(transaction_id: Any) -> str:
+        """Encode the last transaction ID of a page as an opaque cursor."""
+        return base64.urlsafe_b64encode(str(transaction_id).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> int:
+        """Decode a cursor produced by encode_cursor.
+
+        Raises:
+            QueryBuildError: If the cursor is malformed
+        """
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (ValueError, UnicodeDecodeError):
+            raise QueryBuildError("Invalid pagination cursor")
+
+    @staticmethod
+    async def get_transactions_with_cursor(
+            params: Mapping[str, str],
+            cursor: Optional[str] = None,
+            page_size: Optional[int] = None,
+            columnar: bool = False
+    ) -> Dict[str, Any]:
+        """Get transactions with keyset (cursor) pagination.
+
+        Pages are ordered by transactionId descending (see CURSOR_ORDER_BY),
+        and each page filters on transactionId below the previous page's last
+        ID, so the database never scans and discards earlier pages as it does
+        for OFFSET.
+
+        Args:
+            params: Mapping of query parameters (not modified)
+            cursor: Cursor from the previous page, or None/empty for the first page
+            page_size: Number of records per page (defaults to settings.DEFAULT_LIMIT)
+            columnar: Return the records as {"columns": [...], "rows": [...]}
+
+        Returns:
+            Dictionary with the records and the cursor for the next page
+
+        Raises:
+            QueryBuildError: If the cursor is invalid or the parameters can't be paged by cursor
+            DatabaseError: If there's an error executing the query
+        """
+        if page_size is None:
+            page_size = settings.DEFAULT_LIMIT
+
+        cursor_params = dict(params)
+        cursor_params.pop('cursor', None)
+
+        if 'groupBy' in cursor_params:
+            raise QueryBuildError("Cursor pagination is not supported with groupBy")
+        if cursor_params.get('orderBy', CURSOR_ORDER_BY) != CURSOR_ORDER_BY:
+            raise QueryBuildError(f"Cursor pagination requires orderBy={CURSOR_ORDER_BY}")
+
+        if cursor:
+            if 'transactionId' in cursor_params:
+                raise QueryBuildError("Cursor pagination cannot be combined with a transactionId filter")
+            cursor_params['transactionId'] = f"lt:{TransactionController.decode_cursor(cursor)}"
+
+        # The cursor is built from transactionId, so make sure it is selected
+        select = cursor_params.get('select')
+        added_id = bool(select) and 'transactionId' not in [field.strip() for field in select.split(',')]
+        if added_id:
+            cursor_params['select'] = f"{select},transactionId"
+
+        # Fetch one extra row to find out whether there is a next page
+        cursor_params['orderBy'] = CURSOR_ORDER_BY
+        cursor_params['limit'] = str(page_size + 1)
+        cursor_params.pop('offset', None)
+
+        results = await TransactionController.get_transactions(cursor_params, columnar)
+
+        if columnar:
+            has_next = len(results['rows']) > page_size
+            index = results['columns'].index('transactionId')
+            rows = results['rows'][:page_size]
+            last_id = rows[-1][index] if has_next else None
+            if added_id:
+                # Keep the response shape the caller selected
+                del results['columns'][index]
+                rows = [row[:index] + row[index + 1:] for row in rows]
+            results['rows'] = rows
+        else:
+            has_next = len(results) > page_size
+            results = results[:page_size]
+            last_id = results[-1]['transactionId'] if has_next else None
+            if added_id:
+                for row in results:
+                    del row['transactionId']
+        next_cursor = TransactionController.encode_cursor(last_id) if has_next else None
+
+        return {
+            'data': results,
+            'pagination': {
+                'page_size': page_size,
+                'next_cursor': next_cursor,
+                'has_next': has_next
+            }
+        }
 
     @staticmethod
     async def get_transaction_by_id(transaction_id: int) -> Optional[Dict[str, Any]]:
@@ -136,7 +344,7 @@ class TransactionController:
         params = {"transactionId": str(transaction_id)}
         results = await TransactionController.get_transactions(params)
 
-        if not results or len(results) == 0:
+        if not results:
             return None
 
         return results[0]
@@ -185,35 +393,45 @@ class TransactionController:
         # Create SELECT parameter
         params["select"] = ",".join(select_fields)
 
-        # Execute query
-        results = await TransactionController.get_transactions(params)
+        # Run the transaction query and the related lookups concurrently;
+        # the related lookups only need the transaction ID
+        queries = [TransactionController.get_transactions(params)]
+        if include_companies:
+            queries.append(TransactionService.get_related_companies(transaction_id))
+        if include_advisors:
+            queries.append(TransactionService.get_transaction_advisors(transaction_id))
 
-        if not results or len(results) == 0:
+        outcomes = await asyncio.gather(*queries, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        results, *related = outcomes
+
+        if not results:
             return {}
 
         # Get the main transaction record
         transaction = results[0]
 
-        # If companies are included, get related companies (target, acquirer, etc.)
+        # Attach related companies (target, acquirer, etc.) and advisors if requested
         if include_companies:
-            transaction['relatedCompanies'] = await TransactionService.get_related_companies(transaction_id)
-
-        # If advisors are included, get advisors
+            transaction['relatedCompanies'] = related.pop(0)
         if include_advisors:
-            transaction['advisors'] = await TransactionService.get_transaction_advisors(transaction_id)
+            transaction['advisors'] = related.pop(0)
 
         return transaction
 
     @staticmethod
     async def analyze_transactions(
-            params: Dict[str, str],
+            params: Mapping[str, str],
             analysis_type: str,
             fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Analyze transaction data.
 
         Args:
-            params: Dictionary of query parameters
+            params: Mapping of query parameters (not modified)
             analysis_type: Type of analysis (trend, comparison, distribution)
             fields: Fields to analyze
 
@@ -221,7 +439,7 @@ class TransactionController:
             Analyzed transaction data
         """
         # Create a copy of params to modify
-        request = params.copy()
+        request = dict(params)
 
         # Map fields if provided
         mapped_fields = []
@@ -243,14 +461,14 @@ class TransactionController:
 
         elif analysis_type == "comparison":
             # For comparison, ensure we have category and measure
-            if "groupBy" not in request and mapped_fields and len(mapped_fields) > 0:
+            if "groupBy" not in request and mapped_fields:
                 request["groupBy"] = mapped_fields[0]
             if "select" not in request:
                 request["select"] = "count"
 
         elif analysis_type == "distribution":
             # For distribution, we need to bin values
-            if "select" not in request and mapped_fields and len(mapped_fields) > 0:
+            if "select" not in request and mapped_fields:
                 request["select"] = mapped_fields[0]
 
         # Get analyzed data
@@ -273,7 +491,7 @@ class TransactionController:
             try:
                 schema_info = {
                     "tables_count": len(schema_service.tables) if hasattr(schema_service, "tables") else 0,
-                    "adapter_mode": getattr(settings, "SCHEMA_ADAPTER_MODE", "static"),
+                    "adapter_mode": _SCHEMA_ADAPTER_MODE,
                 }
                 validation_info["schema_info"] = schema_info
             except Exception as e:
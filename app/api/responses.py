@@ -0,0 +1,33 @@
+"""JSON response helpers for API routes."""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def json_default(obj: Any) -> Any:
+    """orjson ``default`` hook for values orjson can't encode natively.
+
+    Snowflake returns Decimal for scaled NUMBER columns and for SUM/AVG
+    aggregates. These are encoded as numbers the way FastAPI's
+    jsonable_encoder does: int when there is no fractional part, float otherwise.
+
+    Raises:
+        TypeError: For any other unsupported type
+    """
+    if isinstance(obj, Decimal):
+        exponent = obj.as_tuple().exponent
+        return int(obj) if isinstance(exponent, int) and exponent >= 0 else float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class DecimalORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also encodes Decimal values (see json_default)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
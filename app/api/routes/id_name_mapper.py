@@ -7,6 +7,9 @@ for various entities in the transaction system, allowing the API to accept both
 from typing import Dict, List, Union, Optional, Tuple
 import re
 
+# Operator prefix on a filter value, e.g. "gte:Finance" or "between:2018,2021"
+_OPERATOR_RE = re.compile(r'^(gte:|lte:|gt:|lt:|ne:|like:|between:)(.+)$')
+
 
 class IDNameMapper:
     """
@@ -97,6 +100,22 @@ class IDNameMapper:
         2: ("Seller", ["selling", "divesting"]),
     }
 
+    # Parallel ID/name tuples (IDs as strings) for building reference payloads
+    TRANSACTION_TYPE_IDS = tuple(str(id) for id in TRANSACTION_TYPES)
+    TRANSACTION_TYPE_NAMES = tuple(name for name, _ in TRANSACTION_TYPES.values())
+    COUNTRY_IDS = tuple(str(id) for id in COUNTRIES)
+    COUNTRY_NAMES = tuple(name for name, _ in COUNTRIES.values())
+    INDUSTRY_IDS = tuple(str(id) for id in INDUSTRIES)
+    INDUSTRY_NAMES = tuple(name for name, _ in INDUSTRIES.values())
+    CURRENCY_IDS = tuple(str(id) for id in CURRENCIES)
+    CURRENCY_LABELS = tuple(f"{name} ({iso_code})" for name, iso_code, _ in CURRENCIES.values())
+    STATUS_IDS = tuple(str(id) for id in STATUSES)
+    STATUS_NAMES = tuple(name for name, _ in STATUSES.values())
+    ADVISOR_TYPE_IDS = tuple(str(id) for id in ADVISOR_TYPES)
+    ADVISOR_TYPE_NAMES = tuple(name for name, _ in ADVISOR_TYPES.values())
+    RELATION_TYPE_IDS = tuple(str(id) for id in RELATION_TYPES)
+    RELATION_TYPE_NAMES = tuple(name for name, _ in RELATION_TYPES.values())
+
     # Reverse mappings
     _transaction_types_reverse = {}
     _countries_reverse = {}
@@ -268,7 +287,7 @@ class IDNameMapper:
             return param_value
 
         # Process operators like gte:, lte:, between:, etc.
-        match = re.match(r'^(gte:|lte:|gt:|lt:|ne:|like:|between:)(.+)$', param_value)
+        match = _OPERATOR_RE.match(param_value)
         if match:
             operator, value = match.groups()
 
@@ -302,6 +321,23 @@ class IDNameMapper:
 # Initialize the reverse maps
 IDNameMapper.build_reverse_maps()
 
+# Name-to-ID converter for each parameter that accepts names
+_PARAM_CONVERTERS = {
+    'type': IDNameMapper.get_transaction_type_id,
+    'transactionIdType': IDNameMapper.get_transaction_type_id,
+    'country': IDNameMapper.get_country_id,
+    'buyerCountry': IDNameMapper.get_country_id,
+    'targetCountry': IDNameMapper.get_country_id,
+    'industry': IDNameMapper.get_industry_id,
+    'buyerIndustry': IDNameMapper.get_industry_id,
+    'targetIndustry': IDNameMapper.get_industry_id,
+    'currencyId': IDNameMapper.get_currency_id,
+    'currency': IDNameMapper.get_currency_id,
+    'statusId': IDNameMapper.get_status_id,
+    'advisorTypeId': IDNameMapper.get_advisor_type_id,
+    'relationType': IDNameMapper.get_relation_type_id,
+}
+
 
 # Module-level functions for easy access
 def convert_param(param_name: str, param_value: str) -> str:
@@ -322,62 +358,14 @@ def convert_param(param_name: str, param_value: str) -> str:
     if param_value.isdigit() or (param_value.startswith('-') and param_value[1:].isdigit()):
         return param_value
 
-    # Check operators and multiple values
-    has_operator = any(
-        op in param_value for op in ['gte:', 'lte:', 'gt:', 'lt:', 'ne:', 'like:', 'between:', 'null:', 'notnull:'])
-    has_multiple = ',' in param_value
-
-    if not has_operator and not has_multiple:
-        # Try direct conversion if it's a simple value
-        if param_name in ['type', 'transactionIdType']:
-            type_id = IDNameMapper.get_transaction_type_id(param_value)
-            return str(type_id) if type_id is not None else param_value
-
-        elif param_name in ['country', 'buyerCountry', 'targetCountry']:
-            country_id = IDNameMapper.get_country_id(param_value)
-            return str(country_id) if country_id is not None else param_value
-
-        elif param_name in ['industry', 'buyerIndustry', 'targetIndustry']:
-            industry_id = IDNameMapper.get_industry_id(param_value)
-            return str(industry_id) if industry_id is not None else param_value
-
-        elif param_name in ['currencyId', 'currency']:
-            currency_id = IDNameMapper.get_currency_id(param_value)
-            return str(currency_id) if currency_id is not None else param_value
-
-        elif param_name == 'statusId':
-            status_id = IDNameMapper.get_status_id(param_value)
-            return str(status_id) if status_id is not None else param_value
-
-        elif param_name == 'advisorTypeId':
-            advisor_type_id = IDNameMapper.get_advisor_type_id(param_value)
-            return str(advisor_type_id) if advisor_type_id is not None else param_value
+    converter = _PARAM_CONVERTERS.get(param_name)
+    if converter is None:
+        return param_value
 
-        elif param_name == 'relationType':
-            relation_type_id = IDNameMapper.get_relation_type_id(param_value)
-            return str(relation_type_id) if relation_type_id is not None else param_value
+    # Try direct conversion if it's a simple value (no operator or list)
+    if ':' not in param_value and ',' not in param_value:
+        converted_id = converter(param_value)
+        return str(converted_id) if converted_id is not None else param_value
 
     # Handle complex parameters with operators or multiple values
-    if param_name in ['type', 'transactionIdType']:
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_transaction_type_id)
-
-    elif param_name in ['country', 'buyerCountry', 'targetCountry']:
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_country_id)
-
-    elif param_name in ['industry', 'buyerIndustry', 'targetIndustry']:
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_industry_id)
-
-    elif param_name in ['currencyId', 'currency']:
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_currency_id)
-
-    elif param_name == 'statusId':
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_status_id)
-
-    elif param_name == 'advisorTypeId':
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_advisor_type_id)
-
-    elif param_name == 'relationType':
-        return IDNameMapper.convert_multi_value_param(param_value, IDNameMapper.get_relation_type_id)
-
-    # Return original value if no conversion applied
-    return param_value
\ No newline at end of file
+    return IDNameMapper.convert_multi_value_param(param_value, converter)
@@ -3,9 +3,13 @@ Main FastAPI application file.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import transaction_routes
 from app.config.settings import settings
+from app.database.connection import close_pool, warmup_pool
+from app.services.transaction_service import TransactionService
+from app.utils.id_name_mapper import IDNameMapper
 
 # Initialize the FastAPI application
 app = FastAPI(
@@ -57,10 +61,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as transaction lists
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(transaction_routes.router)
 
 
+@app.on_event("startup")
+async def startup():
+    # Open pooled database connections before serving requests
+    await warmup_pool()
+
+    # Check the schema once here rather than on every query
+    await TransactionService.check_schema_compatibility()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_pool()
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -73,8 +94,6 @@ async def root():
 if settings.ENVIRONMENT == "development":
     @app.get("/api/test")
     async def test_endpoint():
-        from app.utils.id_name_mapper import IDNameMapper
-
         # Test the ID-Name mapper
         return {
             "transaction_types": {
@@ -100,11 +119,17 @@ if settings.ENVIRONMENT == "development":
         }
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
+    # Pin uvloop/httptools so a missing install fails loudly instead of silently
+    # falling back to asyncio/h11; uvloop does not support Windows
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
@@ -1,10 +1,15 @@
 """API routes for transaction queries with name-to-ID mapping."""
+import logging
 from datetime import datetime
-from typing import Dict, List, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from functools import lru_cache
+from typing import Annotated, Dict, List, Any, FrozenSet, NamedTuple, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.api.dependencies import get_api_key
+from app.api.responses import DecimalORJSONResponse
 from app.query_builder.controllers.transaction_controller import TransactionController
 from app.utils.errors import QueryBuildError, DatabaseError
 from app.config.settings import settings
@@ -14,20 +19,103 @@ from app.utils.id_name_mapper import convert_param, IDNameMapper
 from app.utils.transaction_examples import (
     get_transaction_examples,
     get_example_openapi_extensions,
+    get_encoded_openapi_extensions,
     get_reference_values
 )
 
+# Import msgspec for fast response encoding if available
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # Define API prefix from settings
 API_PREFIX = settings.API_PREFIX
 
+# Parameters whose values may be names that need converting to IDs
+NAME_CONVERTED_PARAMS = frozenset({
+    'type', 'country', 'industry', 'statusId', 'currencyId',
+    'relationType', 'buyerCountry', 'targetCountry',
+    'buyerIndustry', 'targetIndustry', 'advisorTypeId'
+})
+
+# Prefixes of filters that carry no operand to convert
+VALUELESS_PREFIXES = ('null:', 'notnull:')
+
+# Alias parameters moved to their canonical name when that name is not provided
+PARAM_ALIASES = (('company', 'companyId'), ('size', 'transactionSize'))
+
+# Date parameters copied to their announced* equivalents when those are not provided
+DATE_ALIASES = (('year', 'announcedYear'), ('month', 'announcedMonth'), ('day', 'announcedDay'))
+
+
+class QueryPlan(NamedTuple):
+    """Parameter handling that depends only on which parameters were provided."""
+    converted: Tuple[str, ...]
+    moved: Tuple[Tuple[str, str], ...]
+    copied: Tuple[Tuple[str, str], ...]
+    include_advisors: bool
+    include_relationships: bool
+
+
+@lru_cache(maxsize=512)
+def get_query_plan(
+        param_keys: FrozenSet[str],
+        count_only: bool,
+        paginated: bool,
+        analysis_type: Optional[str]
+) -> QueryPlan:
+    """Build the handling plan for a parameter shape.
+
+    Requests that differ only in filter values share the same plan, so the
+    name conversion and alias decisions are made once per shape.
+    """
+    return QueryPlan(
+        converted=tuple(key for key in param_keys if key in NAME_CONVERTED_PARAMS),
+        moved=tuple((src, dst) for src, dst in PARAM_ALIASES
+                    if src in param_keys and dst not in param_keys),
+        copied=tuple((src, dst) for src, dst in DATE_ALIASES
+                     if src in param_keys and dst not in param_keys),
+        include_advisors=bool({'advisorId', 'advisorTypeId', 'advisorCompanyName'} & param_keys),
+        include_relationships=bool({'buyerCountry', 'buyerIndustry', 'targetCountry', 'targetIndustry'} & param_keys)
+    )
+
 
 # Define response models
 class TransactionResponse(BaseModel):
+    """Documented response schema; responses are encoded by _respond."""
     data: List[Dict[str, Any]]  # Using Dict for flexibility
-    query_parameters: Dict[str, str]
+    query_parameters: Dict[str, Any]
     timestamp: str
 
 
+if MSGSPEC_AVAILABLE:
+    class TransactionPayload(msgspec.Struct):
+        """msgspec mirror of TransactionResponse used on the response path."""
+        data: list
+        query_parameters: dict
+        timestamp: str
+
+    # Decimals (scaled NUMBER columns, aggregates) as JSON numbers, not strings
+    _ENC = msgspec.json.Encoder(decimal_format="number")
+
+
+def _respond(data: List[Dict[str, Any]], query_parameters: Dict[str, Any]) -> Response:
+    """Build the transaction response for every query mode.
+
+    The response is encoded directly, without going through response_model
+    validation, and the timestamp is taken here for all modes.
+    """
+    timestamp = datetime.now().isoformat()
+    if MSGSPEC_AVAILABLE:
+        payload = TransactionPayload(data=data, query_parameters=query_parameters, timestamp=timestamp)
+        return Response(content=_ENC.encode(payload), media_type="application/json")
+    return DecimalORJSONResponse({"data": data, "query_parameters": query_parameters, "timestamp": timestamp})
+
+
 class ExampleQuery(BaseModel):
     name: str
     url: str
@@ -35,6 +123,36 @@ class ExampleQuery(BaseModel):
     description: str
 
 
+def _err(status_code: int, detail: str) -> ORJSONResponse:
+    """Build an error response directly instead of raising HTTPException."""
+    return ORJSONResponse({"detail": detail}, status_code=status_code)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values.
+
+    An explicit gzip entry takes precedence over "*"; q=0 means not acceptable.
+    """
+    wildcard = None
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == "gzip":
+            return quality > 0
+        wildcard = quality > 0
+    return bool(wildcard)
+
+
 # Create router
 router = APIRouter(
     prefix=f"{API_PREFIX}",
@@ -68,6 +186,32 @@ async def transaction_examples():
     return get_transaction_examples()
 
 
+@router.get(
+    "/openapi-examples",
+    summary="Transaction API OpenAPI Extensions",
+    description="Returns the example queries and name/ID mappings used to extend the OpenAPI schema.",
+    tags=["documentation"]
+)
+async def openapi_examples(request: Request):
+    """
+    Serves the example queries and name/ID mappings as pre-encoded JSON.
+
+    The payload is static, so it is encoded (and gzip-compressed) once at import
+    and written out directly instead of being re-serialized on every request.
+    """
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=get_encoded_openapi_extensions(gzipped=True),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(
+        content=get_encoded_openapi_extensions(),
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"}
+    )
+
+
 @router.get(
     "/transactions/reference",
     summary="Transaction API Reference Values",
@@ -108,8 +252,6 @@ async def get_openapi_llm(request: Request):
     This endpoint is designed to make it easier for LLMs to generate correct API calls.
     """
     # Get the base OpenAPI schema
-    from fastapi.openapi.utils import get_openapi
-
     app = request.app
     openapi_schema = get_openapi(
         title=app.title,
@@ -589,20 +731,20 @@ async def query_transactions(
             description="Return only the count of matching transactions. Useful with COUNT() aggregations. Examples: true, false.",
             example=False
         ),
-        page: int = Query(
-            None,
+        page: Annotated[Optional[int], Query(
             description="Page number for pagination. Used with page_size. Examples: 1, 2, 3.",
             example=1,
             ge=1,
+            le=100000,
             openapi_extra={"nullable": True}
-        ),
-        page_size: int = Query(
-            None,
+        )] = None,
+        page_size: Annotated[Optional[int], Query(
             description="Number of items per page for pagination. Used with page. Examples: 10, 20, 50.",
             example=10,
             ge=1,
+            le=settings.MAX_LIMIT,
             openapi_extra={"nullable": True}
-        ),
+        )] = None,
         include_relationships: bool = Query(
             False,
             description="Include related company relationships in the response. Examples: true, false.",
@@ -644,27 +786,26 @@ async def query_transactions(
         # Add explicitly defined parameters that were provided (not None)
         for key, value in locals().items():
             if key not in exclude_keys and value is not None:
-                # If it's a string value, check if it needs name-to-ID conversion
-                if isinstance(value, str):
-                    # Convert names to IDs for specific parameters
-                    if key in ['type', 'country', 'industry', 'statusId', 'currencyId',
-                               'relationType', 'buyerCountry', 'targetCountry',
-                               'buyerIndustry', 'targetIndustry', 'advisorTypeId']:
-                        params[key] = convert_param(key, value)
-                    else:
-                        params[key] = value
-                else:
-                    params[key] = value
-
-        # Handle parameter aliases and transformations
-
-        # Handle company parameter alias
-        if 'company' in params and 'companyId' not in params:
-            params['companyId'] = params.pop('company')
-
-        # Handle size parameter alias
-        if 'size' in params and 'transactionSize' not in params:
-            params['transactionSize'] = params.pop('size')
+                params[key] = value
+
+        # Reject malformed ranges before querying
+        for key, value in params.items():
+            if isinstance(value, str) and value.startswith('between:') and ',' not in value:
+                return _err(status.HTTP_400_BAD_REQUEST,
+                            f"Invalid between filter for {key}: expected 'between:start,end'")
+
+        # Look up the handling plan for this parameter shape
+        plan = get_query_plan(frozenset(params), bool(count_only), page is not None, analysis_type)
+
+        # Convert names to IDs for specific parameters (null/notnull filters have no names)
+        for key in plan.converted:
+            value = params[key]
+            if not value.startswith(VALUELESS_PREFIXES):
+                params[key] = convert_param(key, value)
+
+        # Handle parameter aliases (company -> companyId, size -> transactionSize)
+        for src, dst in plan.moved:
+            params[dst] = params.pop(src)
 
         # Handle includeAdvisors string to boolean conversion
         if 'includeAdvisors' in params:
@@ -673,14 +814,8 @@ async def query_transactions(
                 params['include_advisors'] = True
 
         # Handle announced date components from year/month/day if not using announcedYear/Month/Day
-        if 'year' in params and 'announcedYear' not in params:
-            params['announcedYear'] = params.get('year')
-
-        if 'month' in params and 'announcedMonth' not in params:
-            params['announcedMonth'] = params.get('month')
-
-        if 'day' in params and 'announcedDay' not in params:
-            params['announcedDay'] = params.get('day')
+        for src, dst in plan.copied:
+            params[dst] = params[src]
 
         # Handle special operation modes
         # -----------------------------
@@ -699,39 +834,23 @@ async def query_transactions(
             )
 
             if not transaction:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Transaction {transaction_id} not found"
-                )
-
-            return {
-                "data": [transaction],
-                "query_parameters": {"transactionId": transaction_id, **params},
-                "timestamp": datetime.now().isoformat()
-            }
+                return _err(status.HTTP_404_NOT_FOUND, f"Transaction {transaction_id} not found")
+
+            return _respond([transaction], {"transactionId": transaction_id, **params})
 
         # Check if count-only mode is requested
         count_only = params.pop('count_only', False)
         if count_only:
             count = await TransactionController.count_transactions(params)
-            return {
-                "data": [{"count": count}],
-                "query_parameters": params,
-                "timestamp": datetime.now().isoformat()
-            }
+            return _respond([{"count": count}], params)
 
         # Check if pagination is requested
         page = params.pop('page', None)
         page_size = params.pop('page_size', None)
         if page is not None:
-            try:
-                page_num = int(page)
-                page_size_num = int(page_size) if page_size else settings.DEFAULT_LIMIT
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid page or page_size parameter"
-                )
+            # Both values were bounds-checked by the Query declarations
+            page_num = page
+            page_size_num = page_size or settings.DEFAULT_LIMIT
 
             result = await TransactionController.get_transactions_with_pagination(
                 params,
@@ -739,17 +858,13 @@ async def query_transactions(
                 page_size_num
             )
 
-            return {
-                "data": result['data'],
-                "query_parameters": {
-                    **params,
-                    "page": str(page),
-                    "page_size": str(page_size_num),
-                    "total_count": str(result['pagination']['total_count']),
-                    "total_pages": str(result['pagination']['total_pages'])
-                },
-                "timestamp": datetime.now().isoformat()
-            }
+            # The controller works on its own copy, so echo pagination info in place
+            params['page'] = page_num
+            params['page_size'] = page_size_num
+            params['total_count'] = result['pagination']['total_count']
+            params['total_pages'] = result['pagination']['total_pages']
+
+            return _respond(result['data'], params)
 
         # Handle special relationship parameters
         # --------------------------------------
@@ -769,10 +884,7 @@ async def query_transactions(
             if currency_id:
                 params['currencyId'] = str(currency_id)
             else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Unknown currency ISO code: {iso_code}"
-                )
+                return _err(status.HTTP_400_BAD_REQUEST, f"Unknown currency ISO code: {iso_code}")
 
         # Handle analytics parameters
         # --------------------------
@@ -786,26 +898,15 @@ async def query_transactions(
             # Execute analysis
             result = await TransactionController.analyze_transactions(params, analysis_type, fields_list)
 
-            return {
-                "data": result,
-                "query_parameters": {
-                    **params,
-                    "analysisType": analysis_type,
-                    "fields": fields_str or ""
-                },
-                "timestamp": datetime.now().isoformat()
-            }
+            return _respond(result, {**params, "analysisType": analysis_type, "fields": fields_str or ""})
 
         # Check for advisor relationships
-        advisor_id = params.get('advisorId', None)
-        advisor_type = params.get('advisorTypeId', None)
-        if advisor_id or advisor_type or 'advisorCompanyName' in params:
+        if plan.include_advisors:
             # Set flag to include advisor information
             params['include_advisors'] = True
 
         # Handle entity specific queries
-        if ('buyerCountry' in params or 'buyerIndustry' in params or
-                'targetCountry' in params or 'targetIndustry' in params):
+        if plan.include_relationships:
             # These fields indicate cross-entity filtering
             params['include_relationships'] = True
 
@@ -813,18 +914,13 @@ async def query_transactions(
         # -----------------------
         result = await TransactionController.get_transactions(params)
 
-        return {
-            "data": result,
-            "query_parameters": params,
-            "timestamp": datetime.now().isoformat()
-        }
+        return _respond(result, params)
 
     except QueryBuildError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except DatabaseError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}"
-        )
\ No newline at end of file
+    except Exception:
+        logger.exception("Transaction query failed")
+        # Details go to the log, not the client
+        return _err(status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal error")
\ No newline at end of file
@@ -1,10 +1,17 @@
 """API routes for transaction data."""
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
+import orjson
 from fastapi import APIRouter, Query, Depends, HTTPException, Path, Body, Request
+from fastapi.responses import StreamingResponse
 
+from app.api.responses import DecimalORJSONResponse, json_default
 from app.controllers.transaction_controller import TransactionController
 from app.utils.errors import QueryBuildError, DatabaseError, SchemaCompatibilityError
 from app.config.settings import settings
+from app.models import PaginationParams
 from app.api.dependencies import (
     get_pagination_params,
     get_api_key,
@@ -20,10 +27,25 @@ try:
 except ImportError:
     SCHEMA_SERVICE_AVAILABLE = False
 
+
+async def validated_filters(request: Request) -> Mapping:
+    """Dependency returning the request's query parameters after checking between filters.
+
+    Raises:
+        HTTPException: If a between filter does not have two bounds
+    """
+    raw = request.query_params
+    for key, value in raw.items():
+        if value.startswith("between:") and "," not in value:
+            raise HTTPException(status_code=400, detail=f"Invalid between filter for {key}: expected 'between:start,end'")
+    return raw
+
+
 # Create router
 router = APIRouter(
     prefix=f"{settings.API_PREFIX}",
     tags=["transactions"],
+    default_response_class=DecimalORJSONResponse,
     responses={
         400: {"description": "Bad Request"},
         500: {"description": "Internal Server Error"}
@@ -33,58 +55,62 @@ router = APIRouter(
 
 @router.get("/transactions")
 async def get_transactions(
-        # Filter parameters
-        type: Optional[str] = Query(None, description="Transaction type ID"),
-        year: Optional[str] = Query(None, description="Announced year"),
-        month: Optional[str] = Query(None, description="Announced month"),
-        day: Optional[str] = Query(None, description="Announced day"),
-        country: Optional[str] = Query(None, description="Country ID"),
-        industry: Optional[str] = Query(None, description="Industry ID"),
-        company: Optional[str] = Query(None, description="Company ID"),
-        companyName: Optional[str] = Query(None, description="Company name"),
-        size: Optional[str] = Query(None, description="Transaction size"),
-
-        # Structure parameters
-        select: Optional[str] = Query(None, description="Fields to select (comma-separated)"),
-        groupBy: Optional[str] = Query(None, description="Fields to group by (comma-separated)"),
-        orderBy: Optional[str] = Query(None, description="Fields to order by with direction (field:asc|desc)"),
-        limit: Optional[int] = Query(None, description="Maximum number of results"),
-        offset: Optional[int] = Query(None, description="Number of results to skip"),
-
         # Pagination parameters
-        page: int = Query(1, ge=1, description="Page number"),
-        page_size: Optional[int] = Query(None, ge=1, le=settings.MAX_LIMIT, description="Items per page"),
-
-        # Get all query parameters
-        request: Request = Depends()
+        pagination: PaginationParams = Depends(get_pagination_params),
+        cursor: Optional[str] = Query(
+            None,
+            description="Keyset pagination cursor; pass an empty value for the first page, then next_cursor"
+        ),
+        format: str = Query(
+            "rows",
+            pattern="^(rows|columnar)$",
+            description="rows: one object per record; columnar: {columns: [...], rows: [[...], ...]}"
+        ),
+
+        # All query parameters, with between filters validated
+        filters: Mapping = Depends(validated_filters)
 ):
     """
     Flexible transaction endpoint that supports various query parameters:
     - Filter fields: type, year, month, day, country, industry, company, size
     - Special operators: gte:, lte:, gt:, lt:, ne:, comma for IN
     - Query structure: select, groupBy, orderBy, limit, offset
+    - Pagination: page/page_size (offset based) or cursor/page_size (keyset, ordered by transactionId desc)
+    - format=columnar: return data as {"columns": [...], "rows": [[...], ...]}, which is smaller
+      and faster to serialize for large pages than one object per record
 
     Examples:
     - /api/v1/transactions?type=1&year=gte:2020&groupBy=companyName&orderBy=count:desc&limit=10
     - /api/v1/transactions?type=14&year=2021&country=131&orderBy=size:desc&limit=20
     - /api/v1/transactions?industry=32,34&country=37&year=2023&orderBy=year:desc,month:desc,day:desc
     """
-    try:
-        # Get all query parameters including ones not explicitly listed
-        params = dict(request.query_params)
+    columnar = format == "columnar"
+    # The format switch is not a filter, so keep it away from the query builder
+    params = filters if "format" not in filters else {
+        key: value for key, value in filters.items() if key != "format"
+    }
 
-        # Convert numeric parameters to strings if needed
-        if limit is not None:
-            params['limit'] = str(limit)
-        if offset is not None:
-            params['offset'] = str(offset)
+    try:
+        # Keyset pagination avoids scanning past earlier pages on deep pages
+        if cursor is not None:
+            result = await TransactionController.get_transactions_with_cursor(
+                params=params,
+                cursor=cursor,
+                page_size=pagination.page_size,
+                columnar=columnar
+            )
+            return DecimalORJSONResponse(result)
 
         # Process request through controller with pagination
-        return await TransactionController.get_transactions_with_pagination(
+        result = await TransactionController.get_transactions_with_pagination(
             params=params,
-            page=page,
-            page_size=page_size
+            page=pagination.page,
+            page_size=pagination.page_size,
+            columnar=columnar
         )
+
+        # Rows are plain dicts already, so skip FastAPI's response encoding pass
+        return DecimalORJSONResponse(result)
     except QueryBuildError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except SchemaCompatibilityError as e:
@@ -99,19 +125,8 @@ async def get_transactions(
 
 @router.get("/transactions/count")
 async def count_transactions(
-        # Filter parameters
-        type: Optional[str] = Query(None, description="Transaction type ID"),
-        year: Optional[str] = Query(None, description="Announced year"),
-        month: Optional[str] = Query(None, description="Announced month"),
-        day: Optional[str] = Query(None, description="Announced day"),
-        country: Optional[str] = Query(None, description="Country ID"),
-        industry: Optional[str] = Query(None, description="Industry ID"),
-        company: Optional[str] = Query(None, description="Company ID"),
-        companyName: Optional[str] = Query(None, description="Company name"),
-        size: Optional[str] = Query(None, description="Transaction size"),
-
-        # Get all query parameters
-        request: Request = Depends()
+        # All query parameters, with between filters validated
+        filters: Mapping = Depends(validated_filters)
 ):
     """
     Count transactions based on filter criteria without returning the actual records.
@@ -119,11 +134,8 @@ async def count_transactions(
     Uses the same filtering parameters as the main transactions endpoint.
     """
     try:
-        # Get all query parameters including ones not explicitly listed
-        params = dict(request.query_params)
-
         # Get count only
-        count = await TransactionController.count_transactions(params=params)
+        count = await TransactionController.count_transactions(params=filters)
         return {"count": count}
     except QueryBuildError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -131,6 +143,47 @@ async def count_transactions(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_json(
+        first: Optional[List[Dict[str, Any]]],
+        batches: AsyncIterator[List[Dict[str, Any]]]
+) -> AsyncIterator[bytes]:
+    """Serialize record batches into a {"data": [...], "count": n} JSON body."""
+    yield b'{"data":['
+    count = 0
+    batch = first
+    while batch:
+        chunk = b','.join(orjson.dumps(row, default=json_default) for row in batch)
+        yield b',' + chunk if count else chunk
+        count += len(batch)
+        batch = await anext(batches, None)
+    yield b'],"count":%d}' % count
+
+
+@router.get("/transactions/stream")
+async def stream_transactions(
+        # All query parameters, with between filters validated
+        filters: Mapping = Depends(validated_filters)
+):
+    """
+    Stream transactions as JSON while rows are still being fetched.
+
+    Uses the same filtering parameters as the main transactions endpoint,
+    without pagination. Suited to large limits: the first bytes go out once
+    the first batch is fetched and the full result is never held in memory.
+    Errors after the first batch end the response early.
+    """
+    batches = TransactionController.stream_transactions(filters)
+    try:
+        # Fetch the first batch up front so query errors still get a status code
+        first = await anext(batches, None)
+    except QueryBuildError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(_stream_json(first, batches), media_type="application/json")
+
+
 @router.get("/transactions/{transaction_id}")
 async def get_transaction_by_id(
         transaction_id: int = Path(..., title="Transaction ID", description="Unique identifier for a transaction"),
@@ -172,16 +225,8 @@ async def analyze_transactions(
         analysis_type: str = Query(..., description="Type of analysis to perform: trend, comparison, distribution"),
         fields: List[str] = Query(None, description="Fields to analyze"),
 
-        # Filter parameters
-        type: Optional[str] = Query(None, description="Transaction type ID"),
-        year: Optional[str] = Query(None, description="Announced year"),
-        month: Optional[str] = Query(None, description="Announced month"),
-        day: Optional[str] = Query(None, description="Announced day"),
-        country: Optional[str] = Query(None, description="Country ID"),
-        industry: Optional[str] = Query(None, description="Industry ID"),
-
-        # Get all query parameters
-        request: Request = Depends()
+        # All query parameters, with between filters validated
+        filters: Mapping = Depends(validated_filters)
 ):
     """
     Analyze transaction data based on specified parameters.
@@ -192,15 +237,13 @@ async def analyze_transactions(
     - distribution: Analyze distribution of values
     """
     try:
-        # Get all query parameters
-        params = dict(request.query_params)
-
         # Get analyzed data through controller
-        return await TransactionController.analyze_transactions(
-            params=params,
+        result = await TransactionController.analyze_transactions(
+            params=filters,
             analysis_type=analysis_type,
             fields=fields
         )
+        return DecimalORJSONResponse(result)
     except QueryBuildError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except DatabaseError as e:
@@ -235,22 +278,23 @@ async def protected_transactions(
         # Auth dependency
         api_key: Dict[str, Any] = Depends(get_api_key),
 
-        # Get all query parameters
-        request: Request = Depends()
+        # All query parameters, with between filters validated
+        filters: Mapping = Depends(validated_filters)
 ):
     """
     Protected transaction endpoint that requires API key.
     """
-    # Get all query parameters
-    params = dict(request.query_params)
-
-    # Apply pagination
-    params["limit"] = str(page_size or settings.DEFAULT_LIMIT)
-    params["offset"] = str((page - 1) * (page_size or settings.DEFAULT_LIMIT))
+    # Get all query parameters with pagination applied
+    limit = page_size or settings.DEFAULT_LIMIT
+    params = {
+        **filters,
+        "limit": str(limit),
+        "offset": str((page - 1) * limit)
+    }
 
     # Process request through controller
     try:
-        return await TransactionController.get_transactions(params)
+        return DecimalORJSONResponse(await TransactionController.get_transactions(params))
     except QueryBuildError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except DatabaseError as e:
@@ -259,15 +303,28 @@ async def protected_transactions(
 
 # Schema management related endpoints
 if SCHEMA_SERVICE_AVAILABLE:
+    @lru_cache(maxsize=4)
+    def _sorted_mapping_keys(version: Any) -> Tuple[str, ...]:
+        """Sorted field mapping names for prefix lookups, cached per schema version."""
+        return tuple(sorted(schema_service.field_mappings))
+
+
     @router.get("/schema/field-mappings")
     async def get_field_mappings(prefix: Optional[str] = None):
         """Get field mappings from schema service."""
         try:
             mappings = schema_service.field_mappings
 
-            # Filter by prefix if provided
+            # Filter by prefix if provided, using the sorted names to jump straight to the matches
             if prefix:
-                mappings = {k: v for k, v in mappings.items() if k.startswith(prefix)}
+                keys = _sorted_mapping_keys(getattr(schema_service, "version", None))
+                filtered = {}
+                for i in range(bisect_left(keys, prefix), len(keys)):
+                    key = keys[i]
+                    if not key.startswith(prefix):
+                        break
+                    filtered[key] = mappings[key]
+                mappings = filtered
 
             return mappings
         except Exception as e:
@@ -283,45 +340,58 @@ if SCHEMA_SERVICE_AVAILABLE:
             raise HTTPException(status_code=500, detail=f"Error getting join paths: {str(e)}")
 
 
+    @lru_cache(maxsize=256)
+    def _serialize_table_info(table_name: str, version: Any) -> Optional[Dict[str, Any]]:
+        """Serialize a table's schema information.
+
+        Cached per schema version, so a schema reload yields fresh results.
+        """
+        table_info = schema_service.get_table_info(table_name)
+        if not table_info:
+            return None
+
+        # Convert to serializable format
+        serializable = {
+            "name": table_info.name,
+            "alias": table_info.alias,
+            "columns": [],
+            "primary_keys": table_info.primary_keys,
+            "joins": []
+        }
+
+        # Add columns
+        for name, col in table_info.columns.items():
+            serializable["columns"].append({
+                "name": name,
+                "field_id": col.field_id,
+                "data_type": col.data_type,
+                "nullable": col.nullable,
+                "is_primary": col.is_primary
+            })
+
+        # Add joins
+        for key, join in table_info.joins.items():
+            serializable["joins"].append({
+                "key": key,
+                "target_table": join.target_table,
+                "target_alias": join.target_alias,
+                "join_type": join.join_type,
+                "requires": list(join.requires)
+            })
+
+        return serializable
+
+
     @router.get("/schema/table/{table_name}")
     async def get_table_info(table_name: str):
         """Get detailed information about a table."""
         try:
-            table_info = schema_service.get_table_info(table_name)
-            if not table_info:
+            serializable = _serialize_table_info(table_name, getattr(schema_service, "version", None))
+            if serializable is None:
                 raise HTTPException(status_code=404, detail=f"Table {table_name} not found")
 
-            # Convert to serializable format
-            serializable = {
-                "name": table_info.name,
-                "alias": table_info.alias,
-                "columns": [],
-                "primary_keys": table_info.primary_keys,
-                "joins": []
-            }
-
-            # Add columns
-            for name, col in table_info.columns.items():
-                serializable["columns"].append({
-                    "name": name,
-                    "field_id": col.field_id,
-                    "data_type": col.data_type,
-                    "nullable": col.nullable,
-                    "is_primary": col.is_primary
-                })
-
-            # Add joins
-            for key, join in table_info.joins.items():
-                serializable["joins"].append({
-                    "key": key,
-                    "target_table": join.target_table,
-                    "target_alias": join.target_alias,
-                    "join_type": join.join_type,
-                    "requires": list(join.requires)
-                })
-
             return serializable
         except HTTPException:
             raise
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error getting table info: {str(e)}")
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=f"Error getting table info: {str(e)}")
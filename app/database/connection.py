@@ -1,22 +1,389 @@
-def get_snowflake_connection() -> SnowflakeConnection:
-    """Create and return a Snowflake connection with minimal testing."""
-    try:
-        # Create a new connection
-        conn = snowflake.connector.connect(
-            user=settings.SNOWFLAKE_USER,
-            password=settings.SNOWFLAKE_PASSWORD,
-            account=settings.SNOWFLAKE_ACCOUNT,
-            warehouse=settings.SNOWFLAKE_WAREHOUSE,
-            database=settings.SNOWFLAKE_DATABASE,
-            schema=settings.SNOWFLAKE_SCHEMA
-        )
-
-        # Test with a very simple query that doesn't access metadata
+"""Snowflake database connection management."""
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+import snowflake.connector
+from snowflake.connector import DictCursor, SnowflakeConnection
+from snowflake.connector.errors import InterfaceError, OperationalError
+
+from app.config.settings import settings
+from app.utils.errors import DatabaseError
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Seconds between status checks while an asynchronous query is running
+QUERY_POLL_INTERVAL = 0.05
+
+# Timeout used when a request asks for one with an invalid value, in seconds
+DEFAULT_QUERY_TIMEOUT = 300
+
+# Rows fetched per batch by execute_query_stream
+STREAM_BATCH_SIZE = 1000
+
+# Seconds allowed for logging in and for each network request
+CONNECT_TIMEOUT = 30
+
+# Connection pool: idle connections plus a semaphore bounding open connections
+_max_pool_size = getattr(settings, 'SNOWFLAKE_POOL_SIZE', 10)
+_idle: "asyncio.Queue[SnowflakeConnection]" = asyncio.Queue(maxsize=_max_pool_size)
+_sem = asyncio.Semaphore(_max_pool_size)
+
+# Connections opened ahead of the first request by warmup_pool()
+_min_pool_size = min(getattr(settings, 'SNOWFLAKE_POOL_MIN_SIZE', 2), _max_pool_size)
+
+# Seconds between background health checks of idle pooled connections
+REAPER_INTERVAL = 60
+_reaper_task: Optional[asyncio.Task] = None
+
+
+@lru_cache(maxsize=1)
+def _conn_kwargs() -> Dict[str, Any]:
+    """Connection arguments, read from settings once.
+
+    Call _conn_kwargs.cache_clear() after reloading settings.
+    """
+    return dict(
+        user=settings.SNOWFLAKE_USER,
+        password=settings.SNOWFLAKE_PASSWORD,
+        account=settings.SNOWFLAKE_ACCOUNT,
+        warehouse=settings.SNOWFLAKE_WAREHOUSE,
+        database=settings.SNOWFLAKE_DATABASE,
+        schema=settings.SNOWFLAKE_SCHEMA,
+        login_timeout=CONNECT_TIMEOUT,
+        network_timeout=CONNECT_TIMEOUT,
+        # Server-side binding, so statements differing only in bind values
+        # share one SQL text (and Snowflake's compiled plan)
+        paramstyle="numeric"
+    )
+
+
+async def get_snowflake_connection() -> SnowflakeConnection:
+    """Create and return a Snowflake connection.
+
+    connect() already authenticates, so no test query is run. The blocking
+    connector call runs in a worker thread so the event loop stays free
+    while the connection is established.
+    """
+    try:
+        return await asyncio.to_thread(snowflake.connector.connect, **_conn_kwargs())
+    except Exception as e:
+        logger.error(f"Error connecting to Snowflake: {str(e)}")
+        raise DatabaseError(f"Database connection error: {str(e)}")
+
+
+def _ping(conn: SnowflakeConnection) -> bool:
+    """Check that a connection still answers a trivial query (blocking)."""
+    try:
         cursor = conn.cursor()
-        cursor.execute("SELECT 1 AS test_col")
+        cursor.execute("SELECT 1")
         cursor.close()
+        return True
+    except Exception:
+        return False
+
+
+async def _reaper() -> None:
+    """Periodically health-check idle connections and drop stale ones.
+
+    Each connection is checked while holding a pool slot, so the pool never
+    opens more than its maximum number of connections.
+    """
+    while True:
+        await asyncio.sleep(REAPER_INTERVAL)
+        for _ in range(_idle.qsize()):
+            async with _sem:
+                try:
+                    conn = _idle.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if await asyncio.to_thread(_ping, conn):
+                    _idle.put_nowait(conn)
+                else:
+                    logger.info("Dropping stale pooled Snowflake connection")
+                    await asyncio.to_thread(conn.close)
+
+
+def _ensure_reaper() -> None:
+    """Start the background reaper on the running loop if it is not running."""
+    global _reaper_task
+    if _reaper_task is None or _reaper_task.done():
+        _reaper_task = asyncio.get_running_loop().create_task(_reaper())
+
+
+async def acquire(fresh: bool = False) -> SnowflakeConnection:
+    """Borrow a connection from the pool, opening a new one if none is idle.
+
+    Pooled connections are not probed on borrow; the background reaper
+    checks idle connections instead. Waits while the pool is at its maximum
+    size. Every acquired connection must be handed back with release().
+
+    Args:
+        fresh: Skip idle connections and always open a new one
+    """
+    _ensure_reaper()
+    await _sem.acquire()
+    if not fresh:
+        try:
+            return _idle.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+    try:
+        return await get_snowflake_connection()
+    except BaseException:
+        _sem.release()
+        raise
+
+
+async def release(conn: SnowflakeConnection, discard: bool = False) -> None:
+    """Return a connection to the pool.
+
+    Args:
+        conn: Connection obtained from acquire()
+        discard: Close the connection instead of reusing it (e.g. after an error)
+    """
+    try:
+        if discard or conn.is_closed() or _idle.full():
+            await asyncio.to_thread(conn.close)
+        else:
+            _idle.put_nowait(conn)
+    finally:
+        _sem.release()
+
 
-        return conn
+async def warmup_pool() -> None:
+    """Open the pool's minimum number of connections ahead of the first request.
+
+    Called at application startup so requests right after boot don't each
+    pay for authenticating a new connection. Connections that fail to open
+    are logged and left to be opened on demand.
+    """
+    _ensure_reaper()
+    count = min(_min_pool_size, _idle.maxsize - _idle.qsize())
+    outcomes = await asyncio.gather(
+        *[get_snowflake_connection() for _ in range(count)],
+        return_exceptions=True
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            logger.warning(f"Could not open pooled Snowflake connection at startup: {str(outcome)}")
+        else:
+            _idle.put_nowait(outcome)
+    logger.info(f"Snowflake connection pool warmed up with {_idle.qsize()} connections")
+
+
+async def close_pool() -> None:
+    """Stop the reaper and close all idle pooled connections (at shutdown)."""
+    global _reaper_task
+    if _reaper_task is not None:
+        _reaper_task.cancel()
+        _reaper_task = None
+
+    while not _idle.empty():
+        conn = _idle.get_nowait()
+        try:
+            await asyncio.to_thread(conn.close)
+        except Exception as e:
+            logger.warning(f"Error closing pooled Snowflake connection: {str(e)}")
+
+
+def _cancel_query(conn: SnowflakeConnection, query_id: str) -> None:
+    """Cancel a running query on the server (blocking); failures are only logged."""
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT SYSTEM$CANCEL_QUERY(:1)", (query_id,))
+        cursor.close()
     except Exception as e:
-        logger.error(f"Error connecting to Snowflake: {str(e)}")
-        raise DatabaseError(f"Database connection error: {str(e)}")
\ No newline at end of file
+        logger.warning(f"Could not cancel query {query_id}: {str(e)}")
+
+
+async def _submit(
+        conn: SnowflakeConnection,
+        cursor: Any,
+        sql_query: str,
+        binds: Optional[Sequence[Any]],
+        timeout: Optional[int]
+) -> None:
+    """Submit a query and wait for its results to be ready on the cursor.
+
+    If the caller is cancelled (timeout or client disconnect) at any point,
+    including while the query is still being submitted, the query is
+    cancelled on the server as well.
+    """
+    # The worker thread can't be interrupted, so keep the submission running
+    # on cancellation and wait for it to learn the query ID
+    submit = asyncio.ensure_future(
+        asyncio.to_thread(cursor.execute_async, sql_query, binds, timeout=timeout)
+    )
+    try:
+        await asyncio.shield(submit)
+        query_id = cursor.sfqid
+
+        # Wait for the query to finish without holding the event loop
+        while conn.is_still_running(await asyncio.to_thread(conn.get_query_status_throw_if_error, query_id)):
+            await asyncio.sleep(QUERY_POLL_INTERVAL)
+    except asyncio.CancelledError:
+        # Timed out or abandoned by the client: stop the warehouse work too
+        await asyncio.wait([submit])
+        if not submit.cancelled() and submit.exception() is None and cursor.sfqid:
+            await asyncio.to_thread(_cancel_query, conn, cursor.sfqid)
+        raise
+
+    await asyncio.to_thread(cursor.get_results_from_sfqid, query_id)
+
+
+async def _run_query(
+        conn: SnowflakeConnection,
+        sql_query: str,
+        binds: Optional[Sequence[Any]],
+        timeout: Optional[int],
+        columnar: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Run a query on a connection without blocking the event loop."""
+    cursor = conn.cursor() if columnar else conn.cursor(DictCursor)
+    await _submit(conn, cursor, sql_query, binds, timeout)
+    rows = await asyncio.to_thread(cursor.fetchall)
+    if columnar:
+        return {'columns': [column[0] for column in cursor.description], 'rows': rows}
+    return rows
+
+
+async def execute_query(
+        sql_query: str,
+        binds: Optional[Sequence[Any]] = None,
+        *,
+        timeout: Optional[int] = None,
+        columnar: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Execute a query and return its rows as dictionaries.
+
+    The query is submitted with execute_async and its status is polled with
+    asyncio.sleep, so the event loop is not blocked while Snowflake works.
+    If a pooled connection turns out to be broken, the query is retried once
+    on a freshly opened connection.
+
+    When the timeout expires, or the calling task is cancelled, the running
+    query is cancelled on the server as well.
+
+    Args:
+        sql_query: SQL statement to execute
+        binds: Values for the statement's numeric (:1, :2, ...) placeholders
+        timeout: Optional timeout in seconds for the whole call
+        columnar: Return {"columns": [...], "rows": [tuple, ...]} instead of
+            one dictionary per row
+
+    Returns:
+        List of result rows, or the columnar result
+
+    Raises:
+        DatabaseError: If the connection or the query fails, or the timeout expires
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            return await _execute(sql_query, binds, timeout, columnar)
+    except TimeoutError:
+        logger.error(f"Query timed out after {timeout} seconds")
+        raise DatabaseError(f"Query execution error: timed out after {timeout} seconds")
+
+
+async def _execute(
+        sql_query: str,
+        binds: Optional[Sequence[Any]],
+        timeout: Optional[int],
+        columnar: bool
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Run a query on a pooled connection, retrying once on a broken connection."""
+    fresh = False
+    while True:
+        conn = await acquire(fresh=fresh)
+        discard = False
+        try:
+            return await _run_query(conn, sql_query, binds, timeout, columnar)
+        except OperationalError as e:
+            # Don't hand a possibly broken connection to the next request
+            discard = True
+            if not fresh:
+                logger.warning(f"Connection error, retrying on a new connection: {str(e)}")
+                fresh = True
+                continue
+            logger.error(f"Error executing query: {str(e)}")
+            raise DatabaseError(f"Query execution error: {str(e)}")
+        except Exception as e:
+            # Query errors such as a bad column leave the connection usable
+            discard = isinstance(e, InterfaceError)
+            logger.error(f"Error executing query: {str(e)}")
+            raise DatabaseError(f"Query execution error: {str(e)}")
+        except BaseException:
+            # Cancelled (timeout or client disconnect): an abandoned worker
+            # thread may still be using the connection
+            discard = True
+            raise
+        finally:
+            await release(conn, discard=discard)
+
+
+async def execute_query_stream(
+        sql_query: str,
+        binds: Optional[Sequence[Any]] = None,
+        timeout: Optional[int] = None,
+        batch_size: int = STREAM_BATCH_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Execute a query and yield its rows in batches as they are fetched.
+
+    The pooled connection is held until the iteration finishes or is closed.
+    Unlike execute_query, a broken connection is not retried, since rows may
+    already have been handed out.
+
+    As in execute_query, the timeout covers the whole call: the query and
+    every batch fetch must finish before the deadline, and a query still
+    running when it expires is cancelled on the server. Time spent by the
+    consumer between batches counts too, so a stalled stream can't hold a
+    pooled connection indefinitely.
+
+    Args:
+        sql_query: SQL statement to execute
+        binds: Values for the statement's numeric placeholders
+        timeout: Optional timeout in seconds for the whole stream
+        batch_size: Number of rows per batch
+
+    Yields:
+        Lists of result rows
+
+    Raises:
+        DatabaseError: If the connection or the query fails, or the timeout expires
+    """
+    deadline = asyncio.get_running_loop().time() + timeout if timeout else None
+    conn = await acquire()
+    discard = False
+    try:
+        cursor = conn.cursor(DictCursor)
+        async with asyncio.timeout_at(deadline):
+            await _submit(conn, cursor, sql_query, binds, timeout)
+        while True:
+            async with asyncio.timeout_at(deadline):
+                batch = await asyncio.to_thread(cursor.fetchmany, batch_size)
+            if not batch:
+                break
+            yield batch
+    except TimeoutError:
+        # An abandoned fetch may still be reading on the connection
+        discard = True
+        logger.error(f"Streaming query timed out after {timeout} seconds")
+        raise DatabaseError(f"Query execution error: timed out after {timeout} seconds")
+    except Exception as e:
+        discard = isinstance(e, (OperationalError, InterfaceError))
+        logger.error(f"Error streaming query: {str(e)}")
+        raise DatabaseError(f"Query execution error: {str(e)}")
+    except GeneratorExit:
+        # Closed early by the consumer between batches; nothing is running
+        raise
+    except BaseException:
+        # Cancelled (client disconnect): an abandoned worker thread may still
+        # be using the connection
+        discard = True
+        raise
+    finally:
+        await release(conn, discard=discard)
@@ -1,6 +1,6 @@
 """Pydantic models for request/response schemas."""
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 from app.config.settings import settings
 
@@ -9,10 +9,7 @@ from app.config.settings import settings
 class BaseResponse(BaseModel):
     """Base class for all response models."""
 
-    class Config:
-        """Pydantic configuration."""
-        allow_population_by_field_name = True
-        orm_mode = True
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
 
 # API Documentation models
@@ -31,8 +28,7 @@ class EndpointSchema(BaseModel):
     required_params: List[str] = Field(..., description="List of required parameters")
     allowed_params: List[str] = Field(..., description="List of all allowed parameters")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Query Parameters Models
@@ -46,8 +42,7 @@ class PaginationParams(BaseModel):
         description="Items per page (default: settings.DEFAULT_LIMIT)"
     )
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class QueryParams(BaseModel):
@@ -60,8 +55,7 @@ class QueryParams(BaseModel):
     limit: Optional[int] = Field(None, ge=1, description="Maximum number of results")
     offset: Optional[int] = Field(None, ge=0, description="Number of results to skip")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class TransactionQueryParams(BaseModel):
@@ -85,10 +79,10 @@ class TransactionQueryParams(BaseModel):
     limit: Optional[int] = Field(None, ge=1, description="Maximum number of results")
     offset: Optional[int] = Field(None, ge=0, description="Number of results to skip")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
-    @validator('limit')
+    @field_validator('limit')
+    @classmethod
     def validate_limit(cls, v):
         """Validate that limit doesn't exceed MAX_LIMIT."""
         if v is not None and v > settings.MAX_LIMIT:
@@ -104,7 +98,8 @@ class AnalysisParams(BaseModel):
     )
     fields: Optional[List[str]] = Field(None, description="Fields to analyze")
 
-    @validator('analysis_type')
+    @field_validator('analysis_type')
+    @classmethod
     def validate_analysis_type(cls, v):
         """Validate analysis type is one of the allowed values."""
         allowed_types = ["trend", "comparison", "distribution"]
@@ -112,8 +107,7 @@ class AnalysisParams(BaseModel):
             raise ValueError(f"analysis_type must be one of: {', '.join(allowed_types)}")
         return v
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Response Models
@@ -123,8 +117,7 @@ class ErrorResponse(BaseModel):
     code: Optional[str] = Field(None, description="Error code")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class TransactionSummary(BaseResponse):
@@ -1,9 +1,17 @@
 """Service for handling transaction-related database operations."""
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import re
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
+from functools import partial
+from types import MappingProxyType
+from typing import (
+    Dict, List, Any, AsyncIterator, FrozenSet, Hashable, Iterable, Mapping, Optional, Set, Tuple, Union
+)
 
 from app.query_builder.builder import FlexibleQueryBuilder
-from app.database.connection import execute_query, execute_query_with_timeout
+from app.database.connection import DEFAULT_QUERY_TIMEOUT, execute_query, execute_query_stream
+from app.utils.cache import async_ttl_cache
 from app.utils.errors import QueryBuildError, DatabaseError, SchemaCompatibilityError
 from app.config.settings import settings
 
@@ -19,88 +27,451 @@ except ImportError:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Schema check settings, read once; settings don't change after startup
+_SCHEMA_CHECK_ENABLED = (getattr(settings, 'SCHEMA_VERSION_CHECK_ON_STARTUP', False) and
+                         getattr(settings, 'STRICT_SCHEMA_CHECKING', False))
+_EXPECTED_SCHEMA_HASH = getattr(settings, 'EXPECTED_SCHEMA_HASH', None)
+
+# Results of the ID lookups below are cached in process for this long (seconds)
+RESULT_CACHE_TTL = 300
+RESULT_CACHE_SIZE = 2048
+
+# Parameters that shape the statement itself; their values are never bound
+STRUCTURAL_PARAMS = frozenset({'select', 'groupBy', 'orderBy', 'limit', 'offset'})
+
+# Parameters that don't affect the generated SQL and are left out of the cache key
+NON_SQL_PARAMS = frozenset({'timeout'})
+
+# Filter operators whose operand is a single value that can be bound
+BINDABLE_OPERATORS = frozenset({'', 'eq', 'gt', 'gte', 'lt', 'lte', 'ne'})
+
+# Number of query shapes whose SQL is kept
+STATEMENT_CACHE_SIZE = 1024
+
+# Placeholder values substituted for bindable operands while building a
+# statement. Integer operands get a numeric sentinel and any other operand a
+# text one, so the builder type-checks the sentinel the way it would check the
+# value: a text operand for a numeric field fails the build, and the request
+# falls back to inline values, where the builder rejects it.
+_BIND_SENTINEL_PREFIX = "7310577"
+_BIND_SENTINEL = _BIND_SENTINEL_PREFIX + "{:03d}"
+_TEXT_BIND_SENTINEL = "s" + _BIND_SENTINEL
+_BIND_SENTINEL_RE = re.compile(r"'s?7310577(\d{3})'|(?<![\w%'.])7310577(\d{3})(?![\w%'.])")
+
+# Operands bound with the numeric sentinel
+_INTEGER_OPERAND_RE = re.compile(r"-?\d+")
+
+# A shape value that _query_shape turned into a sentinel
+_SENTINEL_VALUE_RE = re.compile(r"(?:(?:eq|gt|gte|lt|lte|ne):)?s?7310577\d{3}")
+
+# Single-filter ID lookups, the highest-volume requests, whose shape is known
+# without inspecting the parameters
+_FAST_PATH_SHAPES = MappingProxyType({
+    key: ((key, _BIND_SENTINEL.format(0)),)
+    for key in ('transactionId', 'companyId', 'industry')
+})
+
+QueryShape = Tuple[Tuple[str, str], ...]
+
+# Fixed parameters of the related-entity lookups; only the transaction ID varies
+_RELATED_COMPANIES_BASE = MappingProxyType({
+    "select": ("crel.companyid AS companyId, c.companyname AS companyName, "
+               "crt.transactiontocompanyreltype AS role, "
+               "cr.percentacquired AS percentAcquired, "
+               "si.simpleindustrydescription AS industry")
+})
+_RELATED_COMPANIES_JOINS = ('transaction_rel', 'company_rel', 'relation_type', 'company', 'industry')
+
+_ADVISORS_BASE = MappingProxyType({
+    "select": ("advcompany.companyname AS advisorName, "
+               "at.advisortypename AS role")
+})
+_ADVISORS_JOINS = ('advisor_rel', 'advisory_type', 'advisor_company')
+
+_COMPANY_TRANSACTIONS_SELECT = ("tr.transactionid, tr.announcedyear, tr.announcedmonth, tr.announcedday, "
+                                "tr.transactionsize, tr.currencyid, tt.transactionidtypename")
+
+# Company filter parameter for each relationship type; anything else means any involvement
+_COMPANY_RELATIONSHIP_PARAMS = MappingProxyType({
+    "buyer": "buyerId",
+    "seller": "sellerId",
+    "target": "companyId"
+})
+
+_INDUSTRY_STATISTICS_BASE = MappingProxyType({
+    "select": ("si.simpleindustrydescription, "
+               "COUNT(tr.transactionid) AS transactionCount, "
+               "SUM(tr.transactionsize) AS totalValue, "
+               "AVG(tr.transactionsize) AS averageValue, "
+               "MAX(tr.transactionsize) AS maxValue, "
+               "MIN(tr.transactionsize) AS minValue"),
+    "groupBy": "si.simpleindustrydescription"
+})
+
+
+def _query_shape(params: Mapping[str, str]) -> Tuple[QueryShape, List[str]]:
+    """Split request parameters into a hashable query shape and bind values.
+
+    Single-value filter operands are replaced in the shape by numbered
+    sentinels and returned separately, so requests that differ only in
+    those values (and whether each is an integer) share a shape.
+    """
+    shape = []
+    binds = []
+    for key in sorted(params):
+        if key in NON_SQL_PARAMS:
+            continue
+        value = params[key]
+        operator, sep, operand = value.partition(':')
+        if not sep:
+            operator, operand = '', value
+
+        if key in STRUCTURAL_PARAMS or operator not in BINDABLE_OPERATORS or ',' in operand:
+            shape.append((key, value))
+            continue
+
+        template = _BIND_SENTINEL if _INTEGER_OPERAND_RE.fullmatch(operand) else _TEXT_BIND_SENTINEL
+        sentinel = template.format(len(binds))
+        shape.append((key, f"{operator}:{sentinel}" if sep else sentinel))
+        binds.append(operand)
+
+    return tuple(shape), binds
+
+
+def _company_transactions_params(company_id: int, relationship_type: Optional[str]) -> Dict[str, str]:
+    """Parameters for a company's transactions.
+
+    Filters on the relationship's company column, or on any involvement
+    (direct and relationship tables) when none or an unknown one is given.
+    """
+    company_param = _COMPANY_RELATIONSHIP_PARAMS.get(relationship_type, "involvedCompanyId")
+    return {"select": _COMPANY_TRANSACTIONS_SELECT, company_param: str(company_id)}
+
+
+def _timeout_seconds(params: Mapping[str, str]) -> Optional[int]:
+    """Timeout requested with the timeout parameter (the default one if it is invalid or not positive)."""
+    timeout = params.get('timeout')
+    if not timeout:
+        return None
+    try:
+        seconds = int(timeout)
+    except ValueError:
+        return DEFAULT_QUERY_TIMEOUT
+    return seconds if seconds > 0 else DEFAULT_QUERY_TIMEOUT
+
+
+def _schema_version() -> Any:
+    """Version of the loaded schema; changes whenever the schema is reloaded."""
+    return getattr(schema_service, "version", None) if SCHEMA_SERVICE_AVAILABLE else None
+
+
+# The single place builders are created; with the plan cache in front, this
+# only runs when a query shape is seen for the first time
+_new_builder = partial(FlexibleQueryBuilder, settings.SNOWFLAKE_SCHEMA)
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedPlan:
+    """A built statement together with what the builder resolved for it."""
+    sql: str
+    binds: Optional[Tuple[str, ...]]
+    joins: Tuple[str, ...]
+    select_fields: Tuple[Any, ...]
+    conditions: int
+    # Join keys of the tables the statement reads, for targeted invalidation
+    tables: FrozenSet[str] = frozenset()
+
+
+def _build_plan(
+        params: Mapping[str, str],
+        count: bool,
+        required_joins: Tuple[str, ...]
+) -> Tuple[str, Any]:
+    """Run the query builder and return the SQL and the builder."""
+    query_builder = _new_builder()
+    query_builder.parse_request_params(params)
+    for join_key in required_joins:
+        query_builder.add_required_join(join_key)
+    sql_query = query_builder.build_count_query() if count else query_builder.build_query()
+    return sql_query, query_builder
+
+
+def _plan_from_builder(sql_query: str, query_builder: Any, binds: Optional[Tuple[str, ...]]) -> PreparedPlan:
+    return PreparedPlan(
+        sql=sql_query,
+        binds=binds,
+        joins=tuple(j["key"] for j in query_builder.joins),
+        select_fields=tuple(query_builder.select_fields),
+        conditions=len(query_builder.where_conditions),
+        tables=frozenset(j["key"] for j in query_builder.joins)
+    )
+
+
+# Plan cache: LRU of plans per (shape, bind count, count, required joins), plus
+# an index from join key to the cache keys of the plans that read that table.
+# None entries (shapes that can't be bound) and plans without joins are indexed
+# under _UNTAGGED and dropped by every invalidation.
+_plans: "OrderedDict[Hashable, Optional[PreparedPlan]]" = OrderedDict()
+_plans_by_table: Dict[str, Set[Hashable]] = defaultdict(set)
+_UNTAGGED = ""
+
+# Schema version the cached plans were built against; see invalidate_plans()
+_plans_schema_version: Any = None
+
+
+def _plan_tags(plan: Optional[PreparedPlan]) -> Iterable[str]:
+    return (plan.tables if plan is not None else ()) or (_UNTAGGED,)
+
+
+def _forget_plan(key: Hashable, plan: Optional[PreparedPlan]) -> None:
+    for table in _plan_tags(plan):
+        keys = _plans_by_table.get(table)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del _plans_by_table[table]
+
+
+def invalidate_plans(tables: Optional[Iterable[str]] = None, schema_version: Any = None) -> None:
+    """Evict cached plans after a schema change.
+
+    Schema reloads should publish the join keys of the tables that changed,
+    so plans that don't touch them stay cached. A schema version change that
+    was not published this way clears the whole cache on the next request.
+
+    Args:
+        tables: Join keys of the changed tables; None evicts every plan
+        schema_version: Version the schema changed to
+    """
+    global _plans_schema_version
+    _plans_schema_version = schema_version
+
+    if tables is None:
+        _plans.clear()
+        _plans_by_table.clear()
+        return
+
+    for table in (*tables, _UNTAGGED):
+        for key in _plans_by_table.pop(table, ()):
+            plan = _plans.pop(key, None)
+            if plan is not None:
+                _forget_plan(key, plan)
+
+
+def _prepare_statement(
+        shape: QueryShape,
+        bind_count: int,
+        count: bool = False,
+        required_joins: Tuple[str, ...] = ()
+) -> Optional[PreparedPlan]:
+    """Return the cached plan for a query shape, building it on a miss."""
+    # Safety net for schema reloads that didn't publish the changed tables
+    schema_version = _schema_version()
+    if schema_version != _plans_schema_version:
+        invalidate_plans(schema_version=schema_version)
+
+    key = (shape, bind_count, count, required_joins)
+    try:
+        plan = _plans[key]
+    except KeyError:
+        pass
+    else:
+        _plans.move_to_end(key)
+        return plan
+
+    plan = _build_statement_plan(shape, bind_count, count, required_joins)
+    _plans[key] = plan
+    for table in _plan_tags(plan):
+        _plans_by_table[table].add(key)
+    if len(_plans) > STATEMENT_CACHE_SIZE:
+        _forget_plan(*_plans.popitem(last=False))
+    return plan
+
+
+def _build_statement_plan(
+        shape: QueryShape,
+        bind_count: int,
+        count: bool,
+        required_joins: Tuple[str, ...]
+) -> Optional[PreparedPlan]:
+    """Build the plan for a query shape, with numeric bind placeholders in its SQL.
+
+    Returns None when the builder rejects the sentinels or does not emit each
+    of them exactly once as a plain literal; such requests are built with
+    inline values. The same happens when a literal value in the shape (an IN
+    list, a limit, a select expression) contains the sentinel prefix, since it
+    could be mistaken for a placeholder.
+    """
+    if any(_BIND_SENTINEL_PREFIX in value
+           and (key in STRUCTURAL_PARAMS or not _SENTINEL_VALUE_RE.fullmatch(value))
+           for key, value in shape):
+        return None
+
+    try:
+        sql_query, query_builder = _build_plan(dict(shape), count, required_joins)
+    except QueryBuildError:
+        return None
+
+    placed = []
+
+    def placeholder(match: "re.Match[str]") -> str:
+        index = int(match.group(1) or match.group(2))
+        placed.append(index)
+        return f":{index + 1}"
+
+    sql_query = _BIND_SENTINEL_RE.sub(placeholder, sql_query)
+    if sorted(placed) != list(range(bind_count)):
+        return None
+    return _plan_from_builder(sql_query, query_builder, None)
+
+
+def prepare_plan(
+        params: Mapping[str, str],
+        count: bool = False,
+        required_joins: Tuple[str, ...] = ()
+) -> PreparedPlan:
+    """Build the plan for a request, reusing the plan cached for its shape.
+
+    Args:
+        params: Mapping of query parameters (not modified)
+        count: Build the count query instead of the list query
+        required_joins: Join keys to add regardless of the selected fields
+
+    Returns:
+        The plan; its binds are None when the values are inlined in the SQL
+
+    Raises:
+        QueryBuildError: If there's an error building the query
+    """
+    # Fast path: a lone integer ID filter maps straight to its cached plan.
+    # A None plan (the builder rejected the bind) falls through to the general path.
+    if len(params) == 1 and not required_joins:
+        (key, value), = params.items()
+        fast_shape = _FAST_PATH_SHAPES.get(key)
+        if fast_shape is not None and _INTEGER_OPERAND_RE.fullmatch(value):
+            plan = _prepare_statement(fast_shape, 1, count)
+            if plan is not None:
+                return replace(plan, binds=(value,))
+
+    shape, binds = _query_shape(params)
+    plan = _prepare_statement(shape, len(binds), count, required_joins)
+    if plan is not None:
+        return replace(plan, binds=tuple(binds)) if binds else plan
+
+    # Fall back to inlining the values
+    sql_query, query_builder = _build_plan(params, count, required_joins)
+    return _plan_from_builder(sql_query, query_builder, None)
+
 
 class TransactionService:
     """Service for handling transaction database operations."""
 
+    # Result of the startup schema check (see check_schema_compatibility)
+    _schema_ok: bool = True
+    _schema_hashes: Tuple[str, str] = ("", "")
+
+    @staticmethod
+    async def check_schema_compatibility() -> None:
+        """Check the database schema against the expected hash, once at startup.
+
+        Runs when schema management is available and both
+        SCHEMA_VERSION_CHECK_ON_STARTUP and STRICT_SCHEMA_CHECKING are set.
+        An incompatible schema makes every later transaction query raise
+        SchemaCompatibilityError; a failing check is logged and ignored.
+        """
+        if not (SCHEMA_SERVICE_AVAILABLE and _SCHEMA_CHECK_ENABLED):
+            return
+
+        try:
+            from app.schema_management.version import SchemaVersionManager
+            version_manager = SchemaVersionManager()
+            expected_hash = _EXPECTED_SCHEMA_HASH
+
+            if expected_hash:
+                is_compatible = await version_manager.check_schema_compatibility(expected_hash)
+                if not is_compatible:
+                    current_hash = await version_manager.calculate_schema_hash()
+                    logger.warning(
+                        "Schema incompatibility detected! Expected: %s..., Current: %s...",
+                        expected_hash[:8], current_hash[:8])
+                    TransactionService._schema_hashes = (current_hash, expected_hash)
+                    TransactionService._schema_ok = False
+        except Exception as e:
+            logger.warning("Schema compatibility check failed: %s", e)
+            # Continue since this is not critical
+
     @staticmethod
-    async def execute_transaction_query(params: Dict[str, str]) -> List[Dict[str, Any]]:
+    async def execute_transaction_query(
+            params: Mapping[str, str],
+            columnar: bool = False,
+            plan: Optional[PreparedPlan] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Build and execute a transaction query.
 
         Args:
-            params: Dictionary of query parameters
+            params: Mapping of query parameters (not modified)
+            columnar: Return {"columns": [...], "rows": [...]} instead of one dict per record
+            plan: Plan already prepared for params (e.g. by validation); built if omitted
 
         Returns:
-            List of transaction records
+            List of transaction records, or the columnar result
 
         Raises:
             QueryBuildError: If there's an error building the query
             DatabaseError: If there's an error executing the query
         """
         try:
-            # Check schema compatibility if enabled
-            if (SCHEMA_SERVICE_AVAILABLE and
-                    getattr(settings, 'SCHEMA_VERSION_CHECK_ON_STARTUP', False) and
-                    getattr(settings, 'STRICT_SCHEMA_CHECKING', False)):
-
-                try:
-                    # Perform quick compatibility check
-                    from app.schema_management.version import SchemaVersionManager
-                    version_manager = SchemaVersionManager()
-                    expected_hash = getattr(settings, 'EXPECTED_SCHEMA_HASH', None)
-
-                    if expected_hash:
-                        is_compatible = await version_manager.check_schema_compatibility(expected_hash)
-                        if not is_compatible:
-                            current_hash = await version_manager.calculate_schema_hash()
-                            logger.warning(
-                                f"Schema incompatibility detected! Expected: {expected_hash[:8]}..., Current: {current_hash[:8]}...")
-
-                            if getattr(settings, 'STRICT_SCHEMA_CHECKING', False):
-                                raise SchemaCompatibilityError(
-                                    "Database schema has changed and is incompatible with this application version",
-                                    current_hash, expected_hash
-                                )
-                except Exception as e:
-                    logger.warning(f"Schema compatibility check failed: {str(e)}")
-                    # Continue execution since this is not critical
-
-            # Build query from request parameters
-            query_builder = FlexibleQueryBuilder(settings.SNOWFLAKE_SCHEMA)
-            query_builder.parse_request_params(params)
-            sql_query = query_builder.build_query()
-
-            logger.info(f"Executing transaction query: {sql_query}")
-
-            # Check if timeout parameter is provided
-            timeout = params.get('timeout')
-            if timeout:
-                try:
-                    timeout_seconds = int(timeout)
-                    results = await execute_query_with_timeout(sql_query, timeout_seconds)
-                except ValueError:
-                    # Invalid timeout value, use default timeout
-                    results = await execute_query_with_timeout(sql_query)
-            else:
-                # Execute query with default timeout
-                results = await execute_query(sql_query)
+            # Refuse queries when the startup schema check found an incompatible schema
+            if not TransactionService._schema_ok:
+                raise SchemaCompatibilityError(
+                    "Database schema has changed and is incompatible with this application version",
+                    *TransactionService._schema_hashes
+                )
 
-            return results
+            # Build query from request parameters, reusing the plan for its shape
+            if plan is None:
+                plan = prepare_plan(params)
+            sql_query, binds = plan.sql, plan.binds
+
+            logger.info("Executing transaction query: %s", sql_query)
+
+            return await execute_query(sql_query, binds, timeout=_timeout_seconds(params), columnar=columnar)
 
-        except (QueryBuildError, SchemaCompatibilityError):
-            # Re-raise specific errors
-            raise
         except Exception as e:
-            # Handle other errors
-            logger.error(f"Error in transaction service: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Error processing transaction request: {str(e)}")
+            # Re-raise specific errors; wrap anything else
+            if isinstance(e, (QueryBuildError, SchemaCompatibilityError, DatabaseError)):
+                raise
+            logger.error("Error in transaction service: %s", e, exc_info=True)
+            raise DatabaseError(f"Error processing transaction request: {str(e)}") from e
+
+    @staticmethod
+    async def stream_transaction_query(params: Mapping[str, str]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Build a transaction query and yield its records in batches.
+
+        Args:
+            params: Mapping of query parameters (not modified)
+
+        Yields:
+            Lists of transaction records
+
+        Raises:
+            QueryBuildError: If there's an error building the query
+            DatabaseError: If there's an error executing the query
+        """
+        plan = prepare_plan(params)
+        sql_query, binds = plan.sql, plan.binds
+
+        logger.info("Streaming transaction query: %s", sql_query)
+
+        async for batch in execute_query_stream(sql_query, binds):
+            yield batch
 
     @staticmethod
-    async def execute_count_query(params: Dict[str, str]) -> int:
+    async def execute_count_query(params: Mapping[str, str]) -> int:
         """Build and execute a count query.
 
         Args:
-            params: Dictionary of query parameters
+            params: Mapping of query parameters (not modified)
 
         Returns:
             Number of matching transactions
@@ -111,28 +482,26 @@ class TransactionService:
         """
         try:
             # Build count query from request parameters
-            query_builder = FlexibleQueryBuilder(settings.SNOWFLAKE_SCHEMA)
-            query_builder.parse_request_params(params)
-            count_query = query_builder.build_count_query()
+            plan = prepare_plan(params, count=True)
+            count_query, binds = plan.sql, plan.binds
 
-            logger.info(f"Executing transaction count query: {count_query}")
+            logger.info("Executing transaction count query: %s", count_query)
 
             # Execute query
-            results = await execute_query(count_query)
-
-            # Extract count from result
-            if results and len(results) > 0:
-                return results[0].get('total_count', 0)
-            return 0
-        except QueryBuildError:
-            # Re-raise query building errors
-            raise
+            results = await execute_query(count_query, binds)
+
+            # The count query returns a single column; its name depends on how
+            # the builder aliases it and on Snowflake's identifier casing
+            return next(iter(results[0].values())) if results else 0
         except Exception as e:
-            # Handle other errors
-            logger.error(f"Error in transaction count service: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Error processing transaction count request: {str(e)}")
+            # Re-raise specific errors; wrap anything else
+            if isinstance(e, (QueryBuildError, DatabaseError)):
+                raise
+            logger.error("Error in transaction count service: %s", e, exc_info=True)
+            raise DatabaseError(f"Error processing transaction count request: {str(e)}") from e
 
     @staticmethod
+    @async_ttl_cache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
     async def get_related_companies(transaction_id: int) -> List[Dict[str, Any]]:
         """Get companies related to a transaction.
 
@@ -143,32 +512,17 @@ class TransactionService:
             List of related companies with roles
         """
         # Build query for related companies
-        params = {
-            "select": "crel.companyid AS companyId, c.companyname AS companyName, " +
-                      "crt.transactiontocompanyreltype AS role, " +
-                      "cr.percentacquired AS percentAcquired, " +
-                      "si.simpleindustrydescription AS industry",
-            "transactionId": str(transaction_id)
-        }
-
-        # Execute query with dynamic schema adapter
-        query_builder = FlexibleQueryBuilder(settings.SNOWFLAKE_SCHEMA)
-        query_builder.parse_request_params(params)
-
-        # Ensure required joins
-        query_builder.add_required_join('transaction_rel')
-        query_builder.add_required_join('company_rel')
-        query_builder.add_required_join('relation_type')
-        query_builder.add_required_join('company')
-        query_builder.add_required_join('industry')
-
-        # Build and execute query
-        sql_query = query_builder.build_query()
-        results = await execute_query(sql_query)
+        params = {**_RELATED_COMPANIES_BASE, "transactionId": str(transaction_id)}
+
+        # Build with the required joins; the transaction ID is bound, so the
+        # SQL is built once and reused for every transaction
+        plan = prepare_plan(params, required_joins=_RELATED_COMPANIES_JOINS)
+        results = await execute_query(plan.sql, plan.binds)
 
         return results
 
     @staticmethod
+    @async_ttl_cache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
     async def get_transaction_advisors(transaction_id: int) -> List[Dict[str, Any]]:
         """Get advisors for a transaction.
 
@@ -179,26 +533,121 @@ class TransactionService:
             List of advisors with roles
         """
         # Build query for advisors
-        params = {
-            "select": "advcompany.companyname AS advisorName, " +
-                      "at.advisortypename AS role",
-            "transactionId": str(transaction_id)
-        }
+        params = {**_ADVISORS_BASE, "transactionId": str(transaction_id)}
 
-        # Execute query with dynamic schema adapter
-        query_builder = FlexibleQueryBuilder(settings.SNOWFLAKE_SCHEMA)
-        query_builder.parse_request_params(params)
+        # Build with the required joins; the transaction ID is bound, so the
+        # SQL is built once and reused for every transaction
+        plan = prepare_plan(params, required_joins=_ADVISORS_JOINS)
+        results = await execute_query(plan.sql, plan.binds)
 
-        # Ensure required joins
-        query_builder.add_required_join('advisor_rel')
-        query_builder.add_required_join('advisory_type')
-        query_builder.add_required_join('advisor_company')
+        return results
 
-        # Build and execute query
-        sql_query = query_builder.build_query()
-        results = await execute_query(sql_query)
+    @staticmethod
+    async def get_transactions_by_company(company_id: int, relationship_type: Optional[str] = None) -> List[
+        Dict[str, Any]]:
+        """Get transactions by company.
 
-        return results
+        Args:
+            company_id: Company ID
+            relationship_type: Optional relationship type (buyer, seller, target)
+
+        Returns:
+            List of transaction information
+
+        Raises:
+            QueryBuildError: If there's an error building the query
+            DatabaseError: If there's an error executing the query
+        """
+        try:
+            params = _company_transactions_params(company_id, relationship_type)
+
+            # Execute the query
+            return await TransactionService.execute_transaction_query(params)
+
+        except Exception as e:
+            logger.error("Error getting transactions by company: %s", e, exc_info=True)
+            raise QueryBuildError(f"Error getting transactions by company: {str(e)}")
+
+    @staticmethod
+    async def stream_transactions_by_company(
+            company_id: int,
+            relationship_type: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield a company's transactions in batches instead of one list.
+
+        For companies with many transactions; memory stays bounded by the
+        batch size and the first batch is available before the last is fetched.
+
+        Args:
+            company_id: Company ID
+            relationship_type: Optional relationship type (buyer, seller, target)
+
+        Yields:
+            Lists of transaction information
+
+        Raises:
+            QueryBuildError: If there's an error building the query
+            DatabaseError: If there's an error executing the query
+        """
+        params = _company_transactions_params(company_id, relationship_type)
+        async for batch in TransactionService.stream_transaction_query(params):
+            yield batch
+
+    @staticmethod
+    @async_ttl_cache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+    async def get_industry_statistics(industry_id: int, year: Optional[int] = None) -> Dict[str, Any]:
+        """Get statistics for an industry.
+
+        Args:
+            industry_id: Industry ID
+            year: Optional year filter
+
+        Returns:
+            Dictionary of industry statistics
+
+        Raises:
+            QueryBuildError: If there's an error building the query
+            DatabaseError: If there's an error executing the query
+        """
+        try:
+            # Set up statistics parameters
+            params = {**_INDUSTRY_STATISTICS_BASE, "industry": str(industry_id)}
+
+            # Add year filter if specified
+            if year:
+                params["year"] = str(year)
+
+            # Execute the query
+            results = await TransactionService.execute_transaction_query(params)
+
+            if not results:
+                return {
+                    "industry_id": industry_id,
+                    "transaction_count": 0,
+                    "total_value": 0,
+                    "average_value": 0,
+                    "max_value": 0,
+                    "min_value": 0
+                }
+
+            # Return first result (should be only one since we're grouping by industry)
+            return results[0]
+
+        except Exception as e:
+            logger.error("Error getting industry statistics: %s", e, exc_info=True)
+            raise QueryBuildError(f"Error getting industry statistics: {str(e)}")
+
+    @staticmethod
+    def invalidate_cached_results(transaction_id: Optional[int] = None) -> None:
+        """Drop cached related-entity results for a transaction, or all of them.
+
+        Call after writes that change a transaction's related companies or advisors.
+        """
+        for cached in (TransactionService.get_related_companies, TransactionService.get_transaction_advisors):
+            if transaction_id is None:
+                cached.cache_clear()
+            else:
+                cached.invalidate(transaction_id)
 
     @staticmethod
     async def validate_query(params: Dict[str, str]) -> Dict[str, Any]:
@@ -211,19 +660,17 @@ class TransactionService:
             Information about the query
         """
         try:
-            # Build query without executing
-            query_builder = FlexibleQueryBuilder(settings.SNOWFLAKE_SCHEMA)
-            query_builder.parse_request_params(params)
-
-            # Get the SQL query
-            sql_query = query_builder.build_query()
+            # Build (or reuse) the plan without executing; executing the same
+            # params afterwards reuses it from the plan cache
+            plan = prepare_plan(params)
 
             return {
                 "valid": True,
-                "sql_query": sql_query,
-                "joins": [j["key"] for j in query_builder.joins],
-                "select_fields": query_builder.select_fields,
-                "conditions": len(query_builder.where_conditions)
+                "sql_query": plan.sql,
+                "binds": list(plan.binds or ()),
+                "joins": list(plan.joins),
+                "select_fields": list(plan.select_fields),
+                "conditions": plan.conditions
             }
         except Exception as e:
             return {
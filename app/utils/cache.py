@@ -0,0 +1,60 @@
+"""In-process caching helpers."""
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: dict) -> Hashable:
+    """Build a cache key from call arguments (which must be hashable)."""
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+
+def async_ttl_cache(
+        maxsize: int = 2048,
+        ttl: float = 300
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Cache an async function's results per argument tuple, LRU-bounded with expiry.
+
+    The cache is only touched between awaits, so it is safe to share across
+    tasks on one event loop without a lock. Exceptions are not cached.
+    Cached values are shared between callers and must not be mutated.
+
+    The wrapped function gets ``invalidate(*args, **kwargs)`` to drop one
+    entry and ``cache_clear()`` to drop all of them.
+
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Seconds a result stays valid
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = _make_key(args, kwargs)
+            entry = entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    entries.move_to_end(key)
+                    return entry[1]
+                del entries[key]
+
+            value = await func(*args, **kwargs)
+
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            if len(entries) > maxsize:
+                entries.popitem(last=False)
+            return value
+
+        def invalidate(*args: Any, **kwargs: Any) -> None:
+            entries.pop(_make_key(args, kwargs), None)
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -1,5 +1,10 @@
 """Constants for the flexible query builder."""
+import sys
 from enum import IntEnum
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Optional, Tuple
+
+from app.utils.errors import FieldError
 
 # Import schema definitions
 from app.utils.schema import (
@@ -16,8 +21,45 @@ from app.utils.schema import (
     TransactionTypeSchema
 )
 
+
+def _q(alias: str, column: str) -> str:
+    """Qualified column reference, e.g. "tr.transactionid"."""
+    return sys.intern(alias + "." + column)
+
+
+def _field(alias: str, column: str) -> Tuple[str, str, str]:
+    """FIELD_RECORDS entry: interned alias, column and qualified reference."""
+    return sys.intern(alias), sys.intern(column), _q(alias, column)
+
+
+def _expr(expression: str) -> Tuple[None, None, str]:
+    """FIELD_RECORDS entry for a computed expression with no single column."""
+    return None, None, sys.intern(expression)
+
+
+def _on(left: str, right: str) -> str:
+    """Equality join condition between two qualified columns."""
+    return sys.intern(" = ".join((left, right)))
+
+
+def _freeze(mapping: Mapping[str, str]) -> Mapping[str, str]:
+    """Read-only copy of a lookup table with interned keys and values."""
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in mapping.items()})
+
+
+def _freeze_join_paths(paths: Mapping[str, Mapping[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Read-only copy of JOIN_PATHS; "requires" lists become tuples."""
+    return MappingProxyType({
+        sys.intern(name): MappingProxyType({
+            sys.intern(key): tuple(value) if key == "requires" else sys.intern(value)
+            for key, value in path.items()
+        })
+        for name, path in paths.items()
+    })
+
+
 # Table mappings for all database tables
-TABLE_MAPPINGS = {
+TABLE_MAPPINGS: Final[Mapping[str, str]] = _freeze({
     "advisor_types": AdvisorTypeSchema.TABLE,
     "companies": CompanySchema.TABLE,
     "company_rels": CompanyRelSchema.TABLE,
@@ -29,202 +71,218 @@ TABLE_MAPPINGS = {
     "transaction_to_comp_rel_types": TransactionToCompRelTypeSchema.TABLE,
     "transaction_to_company_rels": TransactionToCompanyRelSchema.TABLE,
     "transaction_types": TransactionTypeSchema.TABLE,
-}
+})
 
 # Field mappings for query parameters to database fields
-FIELD_MAPPINGS = {
+FIELD_RECORDS: Final[Mapping[str, Tuple[Optional[str], Optional[str], str]]] = MappingProxyType({
     # Transaction fields
-    "transactionId": f"{TransactionSchema.ALIAS}.{TransactionSchema.ID}",
-    "type": f"{TransactionSchema.ALIAS}.{TransactionSchema.TYPE_ID}",
-    "year": f"{TransactionSchema.ALIAS}.{TransactionSchema.ANNOUNCED_YEAR}",
-    "month": f"{TransactionSchema.ALIAS}.{TransactionSchema.ANNOUNCED_MONTH}",
-    "day": f"{TransactionSchema.ALIAS}.{TransactionSchema.ANNOUNCED_DAY}",
-    "closingYear": f"{TransactionSchema.ALIAS}.{TransactionSchema.CLOSING_YEAR}",
-    "closingMonth": f"{TransactionSchema.ALIAS}.{TransactionSchema.CLOSING_MONTH}",
-    "closingDay": f"{TransactionSchema.ALIAS}.{TransactionSchema.CLOSING_DAY}",
-    "size": f"{TransactionSchema.ALIAS}.{TransactionSchema.TRANSACTION_SIZE}",
-    "currencyId": f"{TransactionSchema.ALIAS}.{TransactionSchema.CURRENCY_ID}",
-    "statusId": f"{TransactionSchema.ALIAS}.{TransactionSchema.STATUS_ID}",
-    "comments": f"{TransactionSchema.ALIAS}.{TransactionSchema.COMMENTS}",
-    "roundNumber": f"{TransactionSchema.ALIAS}.{TransactionSchema.ROUND_NUMBER}",
+    "transactionId": _field(TransactionSchema.ALIAS, TransactionSchema.ID),
+    "type": _field(TransactionSchema.ALIAS, TransactionSchema.TYPE_ID),
+    "year": _field(TransactionSchema.ALIAS, TransactionSchema.ANNOUNCED_YEAR),
+    "month": _field(TransactionSchema.ALIAS, TransactionSchema.ANNOUNCED_MONTH),
+    "day": _field(TransactionSchema.ALIAS, TransactionSchema.ANNOUNCED_DAY),
+    "closingYear": _field(TransactionSchema.ALIAS, TransactionSchema.CLOSING_YEAR),
+    "closingMonth": _field(TransactionSchema.ALIAS, TransactionSchema.CLOSING_MONTH),
+    "closingDay": _field(TransactionSchema.ALIAS, TransactionSchema.CLOSING_DAY),
+    "size": _field(TransactionSchema.ALIAS, TransactionSchema.TRANSACTION_SIZE),
+    "currencyId": _field(TransactionSchema.ALIAS, TransactionSchema.CURRENCY_ID),
+    "statusId": _field(TransactionSchema.ALIAS, TransactionSchema.STATUS_ID),
+    "comments": _field(TransactionSchema.ALIAS, TransactionSchema.COMMENTS),
+    "roundNumber": _field(TransactionSchema.ALIAS, TransactionSchema.ROUND_NUMBER),
 
     # Transaction type fields
-    "transactionType": f"{TransactionTypeSchema.ALIAS}.{TransactionTypeSchema.ID}",
-    "typeName": f"{TransactionTypeSchema.ALIAS}.{TransactionTypeSchema.NAME}",
+    "transactionType": _field(TransactionTypeSchema.ALIAS, TransactionTypeSchema.ID),
+    "typeName": _field(TransactionTypeSchema.ALIAS, TransactionTypeSchema.NAME),
 
     # Company fields
-    "companyId": f"{CompanySchema.ALIAS}.{CompanySchema.ID}",
-    "companyName": f"{CompanySchema.ALIAS}.{CompanySchema.NAME}",
-    "industry": f"{CompanySchema.ALIAS}.{CompanySchema.SIMPLE_INDUSTRY_ID}",
-    "country": f"{CompanySchema.ALIAS}.{CompanySchema.COUNTRY_ID}",
-    "state": f"{CompanySchema.ALIAS}.{CompanySchema.STATE_ID}",
-    "city": f"{CompanySchema.ALIAS}.{CompanySchema.CITY}",
-    "zipCode": f"{CompanySchema.ALIAS}.{CompanySchema.ZIP_CODE}",
-    "companyType": f"{CompanySchema.ALIAS}.{CompanySchema.COMPANY_TYPE_ID}",
-    "companyStatus": f"{CompanySchema.ALIAS}.{CompanySchema.COMPANY_STATUS_TYPE_ID}",
-    "yearFounded": f"{CompanySchema.ALIAS}.{CompanySchema.YEAR_FOUNDED}",
-    "monthFounded": f"{CompanySchema.ALIAS}.{CompanySchema.MONTH_FOUNDED}",
-    "dayFounded": f"{CompanySchema.ALIAS}.{CompanySchema.DAY_FOUNDED}",
-    "incorporationCountry": f"{CompanySchema.ALIAS}.{CompanySchema.INCORPORATION_COUNTRY_ID}",
-    "incorporationState": f"{CompanySchema.ALIAS}.{CompanySchema.INCORPORATION_STATE_ID}",
-    "officePhone": f"{CompanySchema.ALIAS}.{CompanySchema.OFFICE_PHONE}",
-    "officeFax": f"{CompanySchema.ALIAS}.{CompanySchema.OFFICE_FAX}",
-    "otherPhone": f"{CompanySchema.ALIAS}.{CompanySchema.OTHER_PHONE}",
-    "webpage": f"{CompanySchema.ALIAS}.{CompanySchema.WEBPAGE}",
+    "companyId": _field(CompanySchema.ALIAS, CompanySchema.ID),
+    "companyName": _field(CompanySchema.ALIAS, CompanySchema.NAME),
+    "industry": _field(CompanySchema.ALIAS, CompanySchema.SIMPLE_INDUSTRY_ID),
+    "country": _field(CompanySchema.ALIAS, CompanySchema.COUNTRY_ID),
+    "state": _field(CompanySchema.ALIAS, CompanySchema.STATE_ID),
+    "city": _field(CompanySchema.ALIAS, CompanySchema.CITY),
+    "zipCode": _field(CompanySchema.ALIAS, CompanySchema.ZIP_CODE),
+    "companyType": _field(CompanySchema.ALIAS, CompanySchema.COMPANY_TYPE_ID),
+    "companyStatus": _field(CompanySchema.ALIAS, CompanySchema.COMPANY_STATUS_TYPE_ID),
+    "yearFounded": _field(CompanySchema.ALIAS, CompanySchema.YEAR_FOUNDED),
+    "monthFounded": _field(CompanySchema.ALIAS, CompanySchema.MONTH_FOUNDED),
+    "dayFounded": _field(CompanySchema.ALIAS, CompanySchema.DAY_FOUNDED),
+    "incorporationCountry": _field(CompanySchema.ALIAS, CompanySchema.INCORPORATION_COUNTRY_ID),
+    "incorporationState": _field(CompanySchema.ALIAS, CompanySchema.INCORPORATION_STATE_ID),
+    "officePhone": _field(CompanySchema.ALIAS, CompanySchema.OFFICE_PHONE),
+    "officeFax": _field(CompanySchema.ALIAS, CompanySchema.OFFICE_FAX),
+    "otherPhone": _field(CompanySchema.ALIAS, CompanySchema.OTHER_PHONE),
+    "webpage": _field(CompanySchema.ALIAS, CompanySchema.WEBPAGE),
 
     # Simple industry fields
-    "industryDescription": f"{SimpleIndustrySchema.ALIAS}.{SimpleIndustrySchema.DESCRIPTION}",
+    "industryDescription": _field(SimpleIndustrySchema.ALIAS, SimpleIndustrySchema.DESCRIPTION),
 
     # Country fields
-    "countryName": f"{CountryGeoSchema.ALIAS}.{CountryGeoSchema.COUNTRY}",
-    "isoCountry2": f"{CountryGeoSchema.ALIAS}.{CountryGeoSchema.ISO_COUNTRY2}",
-    "isoCountry3": f"{CountryGeoSchema.ALIAS}.{CountryGeoSchema.ISO_COUNTRY3}",
-    "region": f"{CountryGeoSchema.ALIAS}.{CountryGeoSchema.REGION}",
-    "regionId": f"{CountryGeoSchema.ALIAS}.{CountryGeoSchema.REGION_ID}",
+    "countryName": _field(CountryGeoSchema.ALIAS, CountryGeoSchema.COUNTRY),
+    "isoCountry2": _field(CountryGeoSchema.ALIAS, CountryGeoSchema.ISO_COUNTRY2),
+    "isoCountry3": _field(CountryGeoSchema.ALIAS, CountryGeoSchema.ISO_COUNTRY3),
+    "region": _field(CountryGeoSchema.ALIAS, CountryGeoSchema.REGION),
+    "regionId": _field(CountryGeoSchema.ALIAS, CountryGeoSchema.REGION_ID),
 
     # Currency fields
-    "currencyName": f"{CurrencySchema.ALIAS}.{CurrencySchema.NAME}",
-    "isoCode": f"{CurrencySchema.ALIAS}.{CurrencySchema.ISO_CODE}",
-    "majorCurrency": f"{CurrencySchema.ALIAS}.{CurrencySchema.MAJOR_CURRENCY_FLAG}",
+    "currencyName": _field(CurrencySchema.ALIAS, CurrencySchema.NAME),
+    "isoCode": _field(CurrencySchema.ALIAS, CurrencySchema.ISO_CODE),
+    "majorCurrency": _field(CurrencySchema.ALIAS, CurrencySchema.MAJOR_CURRENCY_FLAG),
 
     # Transaction to company relationship fields
-    "relationshipType": f"{TransactionToCompRelTypeSchema.ALIAS}.{TransactionToCompRelTypeSchema.ID}",
-    "relationshipName": f"{TransactionToCompRelTypeSchema.ALIAS}.{TransactionToCompRelTypeSchema.NAME}",
-    "currentInvestment": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.CURRENT_INVESTMENT}",
-    "individualEquity": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.INDIVIDUAL_EQUITY}",
-    "percentAcquired": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.PERCENT_ACQUIRED}",
-    "leadInvestor": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.LEAD_INVESTOR_FLAG}",
+    "relationshipType": _field(TransactionToCompRelTypeSchema.ALIAS, TransactionToCompRelTypeSchema.ID),
+    "relationshipName": _field(TransactionToCompRelTypeSchema.ALIAS, TransactionToCompRelTypeSchema.NAME),
+    "currentInvestment": _field(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.CURRENT_INVESTMENT),
+    "individualEquity": _field(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.INDIVIDUAL_EQUITY),
+    "percentAcquired": _field(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.PERCENT_ACQUIRED),
+    "leadInvestor": _field(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.LEAD_INVESTOR_FLAG),
 
     # Company relationship fields
-    "companyRelId": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.ID}",
-    "companyId2": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.COMPANY_ID2}",
-    "companyRelType": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.COMPANY_REL_TYPE_ID}",
-    "companyRelStakeType": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.COMPANY_REL_STAKE_TYPE_ID}",
-    "percentOwnership": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.PERCENT_OWNERSHIP}",
-    "totalInvestment": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.TOTAL_INVESTMENT}",
+    "companyRelId": _field(CompanyRelSchema.ALIAS, CompanyRelSchema.ID),
+    "companyId2": _field(CompanyRelSchema.ALIAS, CompanyRelSchema.COMPANY_ID2),
+    "companyRelType": _field(CompanyRelSchema.ALIAS, CompanyRelSchema.COMPANY_REL_TYPE_ID),
+    "companyRelStakeType": _field(CompanyRelSchema.ALIAS, CompanyRelSchema.COMPANY_REL_STAKE_TYPE_ID),
+    "percentOwnership": _field(CompanyRelSchema.ALIAS, CompanyRelSchema.PERCENT_OWNERSHIP),
+    "totalInvestment": _field(CompanyRelSchema.ALIAS, CompanyRelSchema.TOTAL_INVESTMENT),
 
     # Advisor fields
-    "advisorType": f"{AdvisorTypeSchema.ALIAS}.{AdvisorTypeSchema.ID}",
-    "advisorTypeName": f"{AdvisorTypeSchema.ALIAS}.{AdvisorTypeSchema.NAME}",
-    "advisorId": f"{TransactionToAdvisorSchema.ALIAS}.{TransactionToAdvisorSchema.COMPANY_ID}",
+    "advisorType": _field(AdvisorTypeSchema.ALIAS, AdvisorTypeSchema.ID),
+    "advisorTypeName": _field(AdvisorTypeSchema.ALIAS, AdvisorTypeSchema.NAME),
+    "advisorId": _field(TransactionToAdvisorSchema.ALIAS, TransactionToAdvisorSchema.COMPANY_ID),
 
     # Special aggregation fields
-    "count": "COUNT(*)",
-    "total": "SUM(tr.transactionsize)",
-    "average": "AVG(tr.transactionsize)",
-    "max": "MAX(tr.transactionsize)",
-    "min": "MIN(tr.transactionsize)"
-}
+    "count": _expr("COUNT(*)"),
+    "total": _expr("SUM(tr.transactionsize)"),
+    "average": _expr("AVG(tr.transactionsize)"),
+    "max": _expr("MAX(tr.transactionsize)"),
+    "min": _expr("MIN(tr.transactionsize)")
+})
+
+# Qualified field per parameter name, derived from FIELD_RECORDS
+FIELD_MAPPINGS: Final[Mapping[str, str]] = MappingProxyType({name: record[2] for name, record in FIELD_RECORDS.items()})
+
+
+def field(name: str, _get=FIELD_MAPPINGS.get) -> str:
+    """Resolve a query parameter field name to its qualified database field.
+
+    Raises:
+        FieldError: If the field name is unknown
+    """
+    column = _get(name)
+    if column is None:
+        raise FieldError(f"Unknown field: {name}")
+    return column
 
 # Join paths for tables
-JOIN_PATHS = {
+JOIN_PATHS: Final[Mapping[str, Mapping[str, Any]]] = _freeze_join_paths({
     "type": {
         "table": TransactionTypeSchema.TABLE,
         "alias": TransactionTypeSchema.ALIAS,
-        "condition": f"{TransactionSchema.ALIAS}.{TransactionSchema.TYPE_ID} = {TransactionTypeSchema.ALIAS}.{TransactionTypeSchema.ID}"
+        "condition": _on(_q(TransactionSchema.ALIAS, TransactionSchema.TYPE_ID), _q(TransactionTypeSchema.ALIAS, TransactionTypeSchema.ID))
     },
     "company": {
         "table": CompanySchema.TABLE,
         "alias": CompanySchema.ALIAS,
-        "condition": f"{TransactionSchema.ALIAS}.{TransactionSchema.COMPANY_ID} = {CompanySchema.ALIAS}.{CompanySchema.ID}"
+        "condition": _on(_q(TransactionSchema.ALIAS, TransactionSchema.COMPANY_ID), _q(CompanySchema.ALIAS, CompanySchema.ID))
     },
     "industry": {
         "table": SimpleIndustrySchema.TABLE,
         "alias": SimpleIndustrySchema.ALIAS,
-        "condition": f"{CompanySchema.ALIAS}.{CompanySchema.SIMPLE_INDUSTRY_ID} = {SimpleIndustrySchema.ALIAS}.{SimpleIndustrySchema.ID}",
+        "condition": _on(_q(CompanySchema.ALIAS, CompanySchema.SIMPLE_INDUSTRY_ID), _q(SimpleIndustrySchema.ALIAS, SimpleIndustrySchema.ID)),
         "requires": ["company"]
     },
     "country": {
         "table": CountryGeoSchema.TABLE,
         "alias": CountryGeoSchema.ALIAS,
-        "condition": f"{CompanySchema.ALIAS}.{CompanySchema.COUNTRY_ID} = {CountryGeoSchema.ALIAS}.{CountryGeoSchema.ID}",
+        "condition": _on(_q(CompanySchema.ALIAS, CompanySchema.COUNTRY_ID), _q(CountryGeoSchema.ALIAS, CountryGeoSchema.ID)),
         "requires": ["company"]
     },
     "currency": {
         "table": CurrencySchema.TABLE,
         "alias": CurrencySchema.ALIAS,
-        "condition": f"{TransactionSchema.ALIAS}.{TransactionSchema.CURRENCY_ID} = {CurrencySchema.ALIAS}.{CurrencySchema.ID}"
+        "condition": _on(_q(TransactionSchema.ALIAS, TransactionSchema.CURRENCY_ID), _q(CurrencySchema.ALIAS, CurrencySchema.ID))
     },
     "transaction_rel": {
         "table": TransactionToCompanyRelSchema.TABLE,
         "alias": TransactionToCompanyRelSchema.ALIAS,
-        "condition": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.TRANSACTION_ID} = {TransactionSchema.ALIAS}.{TransactionSchema.ID}"
+        "condition": _on(_q(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.TRANSACTION_ID), _q(TransactionSchema.ALIAS, TransactionSchema.ID))
     },
     "relation_type": {
         "table": TransactionToCompRelTypeSchema.TABLE,
         "alias": TransactionToCompRelTypeSchema.ALIAS,
-        "condition": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.REL_TYPE_ID} = {TransactionToCompRelTypeSchema.ALIAS}.{TransactionToCompRelTypeSchema.ID}",
+        "condition": _on(_q(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.REL_TYPE_ID), _q(TransactionToCompRelTypeSchema.ALIAS, TransactionToCompRelTypeSchema.ID)),
         "requires": ["transaction_rel"]
     },
     "company_rel": {
         "table": CompanyRelSchema.TABLE,
         "alias": CompanyRelSchema.ALIAS,
-        "condition": f"{TransactionToCompanyRelSchema.ALIAS}.{TransactionToCompanyRelSchema.COMPANY_REL_ID} = {CompanyRelSchema.ALIAS}.{CompanyRelSchema.ID}",
+        "condition": _on(_q(TransactionToCompanyRelSchema.ALIAS, TransactionToCompanyRelSchema.COMPANY_REL_ID), _q(CompanyRelSchema.ALIAS, CompanyRelSchema.ID)),
         "requires": ["transaction_rel"]
     },
     "buyer_company": {
         "table": CompanySchema.TABLE,
         "alias": "buyer",
-        "condition": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.COMPANY_ID} = buyer.{CompanySchema.ID}",
+        "condition": _on(_q(CompanyRelSchema.ALIAS, CompanyRelSchema.COMPANY_ID), _q("buyer", CompanySchema.ID)),
         "requires": ["company_rel"]
     },
     "buyer_industry": {
         "table": SimpleIndustrySchema.TABLE,
         "alias": "buyersi",
-        "condition": f"buyer.{CompanySchema.SIMPLE_INDUSTRY_ID} = buyersi.{SimpleIndustrySchema.ID}",
+        "condition": _on(_q("buyer", CompanySchema.SIMPLE_INDUSTRY_ID), _q("buyersi", SimpleIndustrySchema.ID)),
         "requires": ["buyer_company"]
     },
     "buyer_country": {
         "table": CountryGeoSchema.TABLE,
         "alias": "buyergeo",
-        "condition": f"buyer.{CompanySchema.COUNTRY_ID} = buyergeo.{CountryGeoSchema.ID}",
+        "condition": _on(_q("buyer", CompanySchema.COUNTRY_ID), _q("buyergeo", CountryGeoSchema.ID)),
         "requires": ["buyer_company"]
     },
     "target_company": {
         "table": CompanySchema.TABLE,
         "alias": "target",
-        "condition": f"{CompanyRelSchema.ALIAS}.{CompanyRelSchema.COMPANY_ID2} = target.{CompanySchema.ID}",
+        "condition": _on(_q(CompanyRelSchema.ALIAS, CompanyRelSchema.COMPANY_ID2), _q("target", CompanySchema.ID)),
         "requires": ["company_rel"]
     },
     "target_industry": {
         "table": SimpleIndustrySchema.TABLE,
         "alias": "targetsi",
-        "condition": f"target.{CompanySchema.SIMPLE_INDUSTRY_ID} = targetsi.{SimpleIndustrySchema.ID}",
+        "condition": _on(_q("target", CompanySchema.SIMPLE_INDUSTRY_ID), _q("targetsi", SimpleIndustrySchema.ID)),
         "requires": ["target_company"]
     },
     "target_country": {
         "table": CountryGeoSchema.TABLE,
         "alias": "targetgeo",
-        "condition": f"target.{CompanySchema.COUNTRY_ID} = targetgeo.{CountryGeoSchema.ID}",
+        "condition": _on(_q("target", CompanySchema.COUNTRY_ID), _q("targetgeo", CountryGeoSchema.ID)),
         "requires": ["target_company"]
     },
     "advisory_type": {
         "table": AdvisorTypeSchema.TABLE,
         "alias": AdvisorTypeSchema.ALIAS,
-        "condition": f"{TransactionToAdvisorSchema.ALIAS}.{TransactionToAdvisorSchema.ADVISORY_TYPE_ID} = {AdvisorTypeSchema.ALIAS}.{AdvisorTypeSchema.ID}",
+        "condition": _on(_q(TransactionToAdvisorSchema.ALIAS, TransactionToAdvisorSchema.ADVISORY_TYPE_ID), _q(AdvisorTypeSchema.ALIAS, AdvisorTypeSchema.ID)),
         "requires": ["advisor_rel"]
     },
     "advisor_rel": {
         "table": TransactionToAdvisorSchema.TABLE,
         "alias": TransactionToAdvisorSchema.ALIAS,
-        "condition": f"{TransactionToAdvisorSchema.ALIAS}.{TransactionToAdvisorSchema.TRANSACTION_ID} = {TransactionSchema.ALIAS}.{TransactionSchema.ID}"
+        "condition": _on(_q(TransactionToAdvisorSchema.ALIAS, TransactionToAdvisorSchema.TRANSACTION_ID), _q(TransactionSchema.ALIAS, TransactionSchema.ID))
     },
     "advisor_company": {
         "table": CompanySchema.TABLE,
         "alias": "advcompany",
-        "condition": f"{TransactionToAdvisorSchema.ALIAS}.{TransactionToAdvisorSchema.COMPANY_ID} = advcompany.{CompanySchema.ID}",
+        "condition": _on(_q(TransactionToAdvisorSchema.ALIAS, TransactionToAdvisorSchema.COMPANY_ID), _q("advcompany", CompanySchema.ID)),
         "requires": ["advisor_rel"]
     },
     "currency_country": {
         "table": CountryGeoSchema.TABLE,
         "alias": "curgeo",
-        "condition": f"{CurrencySchema.ALIAS}.{CurrencySchema.COUNTRY_ID} = curgeo.{CountryGeoSchema.ID}",
+        "condition": _on(_q(CurrencySchema.ALIAS, CurrencySchema.COUNTRY_ID), _q("curgeo", CountryGeoSchema.ID)),
         "requires": ["currency"]
     }
-}
+})
+
 
 # Supported filter operators
-FILTER_OPERATORS = {
+FILTER_OPERATORS: Final[Dict[str, str]] = {
     "eq": "=",
     "gte": ">=",
     "lte": "<=",
@@ -242,7 +300,7 @@ FILTER_OPERATORS = {
 }
 
 # Special SQL functions
-SQL_FUNCTIONS = {
+SQL_FUNCTIONS: Final[Dict[str, str]] = {
     "distinct": "DISTINCT({})",
     "count": "COUNT({})",
     "count_distinct": "COUNT(DISTINCT({}))",
@@ -274,7 +332,7 @@ SQL_FUNCTIONS = {
 }
 
 # Security patterns to prevent SQL injection
-SECURITY_PATTERNS = {
+SECURITY_PATTERNS: Final[Dict[str, Any]] = {
     "sql_injection": [
         r";\s*SELECT", r";\s*INSERT", r";\s*UPDATE", r";\s*DELETE", r";\s*DROP",
         r"UNION\s+SELECT", r"--", r"/\*", r"\*/", r"xp_cmdshell", r"exec\s+master"
@@ -333,4 +391,4 @@ class AdvisorType(IntEnum):
     FINANCIAL = 1
     LEGAL = 2
     ACCOUNTING = 3
-    STRATEGIC = 4
\ No newline at end of file
+    STRATEGIC = 4
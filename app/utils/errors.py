@@ -1,4 +1,5 @@
 """Custom error classes for the flexible query builder."""
+import sys
 
 
 class QueryBuildError(Exception):
@@ -65,8 +66,9 @@ class SchemaCompatibilityError(QueryBuildError):
             current_hash: Current schema hash
             expected_hash: Expected schema hash
         """
-        self.current_hash = current_hash
-        self.expected_hash = expected_hash
+        # Interned so repeated checks against the same hash share one string
+        self.current_hash = sys.intern(current_hash) if current_hash else current_hash
+        self.expected_hash = sys.intern(expected_hash) if expected_hash else expected_hash
         super().__init__(message)
 
 
@@ -1,253 +1,288 @@
 """Schema constant definitions for database tables."""
+from typing import NamedTuple
 
-class AdvisorTypeSchema:
+
+class AdvisorTypeSchema(NamedTuple):
     """Constants for the ciqAdvisorType table."""
-    TABLE = "ciqAdvisorType"
-    ALIAS = "at"
+    TABLE: str = "ciqAdvisorType"
+    ALIAS: str = "at"
 
     # Primary keys and foreign keys
-    ID = "advisortypeid"
+    ID: str = "advisortypeid"
 
     # Status fields
-    NAME = "advisortypename"
+    NAME: str = "advisortypename"
 
     # Join condition
     JOIN_CONDITION = "at.advisortypeid = {parent_alias}.{foreign_key}"
 
 
-class CompanySchema:
+AdvisorTypeSchema = AdvisorTypeSchema()
+
+
+class CompanySchema(NamedTuple):
     """Constants for the ciqCompany table."""
-    TABLE = "ciqCompany"
-    ALIAS = "c"
+    TABLE: str = "ciqCompany"
+    ALIAS: str = "c"
 
     # Primary keys and foreign keys
-    ID = "companyid"
+    ID: str = "companyid"
 
     # Date fields
-    YEAR_FOUNDED = "yearfounded"
-    MONTH_FOUNDED = "monthfounded"
-    DAY_FOUNDED = "dayfounded"
+    YEAR_FOUNDED: str = "yearfounded"
+    MONTH_FOUNDED: str = "monthfounded"
+    DAY_FOUNDED: str = "dayfounded"
 
     # Status fields
-    COMPANY_TYPE_ID = "companytypeid"
-    COMPANY_STATUS_TYPE_ID = "companystatustypeid"
+    COMPANY_TYPE_ID: str = "companytypeid"
+    COMPANY_STATUS_TYPE_ID: str = "companystatustypeid"
 
     # ID fields
-    SIMPLE_INDUSTRY_ID = "simpleindustryid"
-    COUNTRY_ID = "countryid"
-    STATE_ID = "stateid"
-    INCORPORATION_COUNTRY_ID = "incorporationcountryid"
-    INCORPORATION_STATE_ID = "incorporationstateid"
+    SIMPLE_INDUSTRY_ID: str = "simpleindustryid"
+    COUNTRY_ID: str = "countryid"
+    STATE_ID: str = "stateid"
+    INCORPORATION_COUNTRY_ID: str = "incorporationcountryid"
+    INCORPORATION_STATE_ID: str = "incorporationstateid"
 
     # Value fields
-    OFFICE_PHONE = "officephonevalue"
-    OFFICE_FAX = "officefaxvalue"
-    OTHER_PHONE = "otherphonevalue"
+    OFFICE_PHONE: str = "officephonevalue"
+    OFFICE_FAX: str = "officefaxvalue"
+    OTHER_PHONE: str = "otherphonevalue"
 
     # Other fields
-    NAME = "companyname"
-    CITY = "city"
-    ZIP_CODE = "zipcode"
-    STREET_ADDRESS1 = "streetaddress1"
-    STREET_ADDRESS2 = "streetaddress2"
-    STREET_ADDRESS3 = "streetaddress3"
-    STREET_ADDRESS4 = "streetaddress4"
-    WEBPAGE = "webpage"
+    NAME: str = "companyname"
+    CITY: str = "city"
+    ZIP_CODE: str = "zipcode"
+    STREET_ADDRESS1: str = "streetaddress1"
+    STREET_ADDRESS2: str = "streetaddress2"
+    STREET_ADDRESS3: str = "streetaddress3"
+    STREET_ADDRESS4: str = "streetaddress4"
+    WEBPAGE: str = "webpage"
 
     # Join condition
     JOIN_CONDITION = "c.companyid = {parent_alias}.{foreign_key}"
 
 
-class CompanyRelSchema:
+CompanySchema = CompanySchema()
+
+
+class CompanyRelSchema(NamedTuple):
     """Constants for the ciqCompanyRel table."""
-    TABLE = "ciqCompanyRel"
-    ALIAS = "crel"
+    TABLE: str = "ciqCompanyRel"
+    ALIAS: str = "crel"
 
     # Primary keys and foreign keys
-    ID = "companyrelid"
+    ID: str = "companyrelid"
 
     # Status fields
-    COMPANY_REL_TYPE_ID = "companyreltypeid"
-    COMPANY_REL_STAKE_TYPE_ID = "companyrelstaketypeid"
+    COMPANY_REL_TYPE_ID: str = "companyreltypeid"
+    COMPANY_REL_STAKE_TYPE_ID: str = "companyrelstaketypeid"
 
     # ID fields
-    COMPANY_ID = "companyid"
+    COMPANY_ID: str = "companyid"
 
     # Other fields
-    COMPANY_ID2 = "companyid2"
-    PERCENT_OWNERSHIP = "percentownership"
-    TOTAL_INVESTMENT = "totalinvestment"
+    COMPANY_ID2: str = "companyid2"
+    PERCENT_OWNERSHIP: str = "percentownership"
+    TOTAL_INVESTMENT: str = "totalinvestment"
 
     # Join condition
     JOIN_CONDITION = "crel.companyrelid = {parent_alias}.{foreign_key}"
 
 
-class CountryGeoSchema:
+CompanyRelSchema = CompanyRelSchema()
+
+
+class CountryGeoSchema(NamedTuple):
     """Constants for the ciqCountryGeo table."""
-    TABLE = "ciqCountryGeo"
-    ALIAS = "geo"
+    TABLE: str = "ciqCountryGeo"
+    ALIAS: str = "geo"
 
     # Primary keys and foreign keys
-    ID = "countryid"
+    ID: str = "countryid"
 
     # ID fields
-    REGION_ID = "regionid"
+    REGION_ID: str = "regionid"
 
     # Value fields
-    COUNTRY = "country"
-    ISO_COUNTRY2 = "isocountry2"
-    ISO_COUNTRY3 = "isocountry3"
+    COUNTRY: str = "country"
+    ISO_COUNTRY2: str = "isocountry2"
+    ISO_COUNTRY3: str = "isocountry3"
 
     # Other fields
-    REGION = "region"
+    REGION: str = "region"
 
     # Join condition
     JOIN_CONDITION = "geo.countryid = {parent_alias}.{foreign_key}"
 
 
-class CurrencySchema:
+CountryGeoSchema = CountryGeoSchema()
+
+
+class CurrencySchema(NamedTuple):
     """Constants for the ciqCurrency table."""
-    TABLE = "ciqCurrency"
-    ALIAS = "cur"
+    TABLE: str = "ciqCurrency"
+    ALIAS: str = "cur"
 
     # Primary keys and foreign keys
-    ID = "currencyid"
+    ID: str = "currencyid"
 
     # ID fields
-    COUNTRY_ID = "countryid"
+    COUNTRY_ID: str = "countryid"
 
     # Flag fields
-    MAJOR_CURRENCY_FLAG = "majorcurrencyflag"
+    MAJOR_CURRENCY_FLAG: str = "majorcurrencyflag"
 
     # Other fields
-    NAME = "currencyname"
-    ISO_CODE = "isocode"
+    NAME: str = "currencyname"
+    ISO_CODE: str = "isocode"
 
     # Join condition
     JOIN_CONDITION = "cur.currencyid = {parent_alias}.{foreign_key}"
 
 
-class SimpleIndustrySchema:
+CurrencySchema = CurrencySchema()
+
+
+class SimpleIndustrySchema(NamedTuple):
     """Constants for the ciqSimpleIndustry table."""
-    TABLE = "ciqSimpleIndustry"
-    ALIAS = "si"
+    TABLE: str = "ciqSimpleIndustry"
+    ALIAS: str = "si"
 
     # Primary keys and foreign keys
-    ID = "simpleindustryid"
+    ID: str = "simpleindustryid"
 
     # Other fields
-    DESCRIPTION = "simpleindustrydescription"
+    DESCRIPTION: str = "simpleindustrydescription"
 
     # Join condition
     JOIN_CONDITION = "si.simpleindustryid = {parent_alias}.{foreign_key}"
 
 
-class TransactionSchema:
+SimpleIndustrySchema = SimpleIndustrySchema()
+
+
+class TransactionSchema(NamedTuple):
     """Constants for the ciqTransaction table."""
-    TABLE = "ciqTransaction"
-    ALIAS = "tr"
+    TABLE: str = "ciqTransaction"
+    ALIAS: str = "tr"
 
     # Primary keys and foreign keys
-    ID = "transactionid"
+    ID: str = "transactionid"
 
     # Date fields
-    ANNOUNCED_YEAR = "announcedyear"
-    ANNOUNCED_MONTH = "announcedmonth"
-    ANNOUNCED_DAY = "announcedday"
-    CLOSING_YEAR = "closingyear"
-    CLOSING_MONTH = "closingmonth"
-    CLOSING_DAY = "closingday"
+    ANNOUNCED_YEAR: str = "announcedyear"
+    ANNOUNCED_MONTH: str = "announcedmonth"
+    ANNOUNCED_DAY: str = "announcedday"
+    CLOSING_YEAR: str = "closingyear"
+    CLOSING_MONTH: str = "closingmonth"
+    CLOSING_DAY: str = "closingday"
 
     # Status fields
-    TYPE_ID = "transactionidtypeid"
-    STATUS_ID = "statusid"
+    TYPE_ID: str = "transactionidtypeid"
+    STATUS_ID: str = "statusid"
 
     # ID fields
-    COMPANY_ID = "companyid"
-    CURRENCY_ID = "currencyid"
+    COMPANY_ID: str = "companyid"
+    CURRENCY_ID: str = "currencyid"
 
     # Value fields
-    TRANSACTION_SIZE = "transactionsize"
+    TRANSACTION_SIZE: str = "transactionsize"
 
     # Other fields
-    COMMENTS = "comments"
-    ROUND_NUMBER = "roundnumber"
+    COMMENTS: str = "comments"
+    ROUND_NUMBER: str = "roundnumber"
 
     # Join condition
     JOIN_CONDITION = "tr.transactionid = {parent_alias}.{foreign_key}"
 
 
-class TransactionToAdvisorSchema:
+TransactionSchema = TransactionSchema()
+
+
+class TransactionToAdvisorSchema(NamedTuple):
     """Constants for the ciqTransactionToAdvisor table."""
-    TABLE = "ciqTransactionToAdvisor"
-    ALIAS = "adv"
+    TABLE: str = "ciqTransactionToAdvisor"
+    ALIAS: str = "adv"
 
     # Primary keys and foreign keys
-    ID = "transactiontoadvisorid"
+    ID: str = "transactiontoadvisorid"
 
     # Status fields
-    ADVISORY_TYPE_ID = "advisortypeid"
+    ADVISORY_TYPE_ID: str = "advisortypeid"
 
     # ID fields
-    TRANSACTION_ID = "transactionid"
-    COMPANY_ID = "companyid"
+    TRANSACTION_ID: str = "transactionid"
+    COMPANY_ID: str = "companyid"
 
     # Join condition
     JOIN_CONDITION = "adv.transactiontoadvisorid = {parent_alias}.{foreign_key}"
 
 
-class TransactionToCompRelTypeSchema:
+TransactionToAdvisorSchema = TransactionToAdvisorSchema()
+
+
+class TransactionToCompRelTypeSchema(NamedTuple):
     """Constants for the ciqTransactionToCompRelType table."""
-    TABLE = "ciqTransactionToCompRelType"
-    ALIAS = "crt"
+    TABLE: str = "ciqTransactionToCompRelType"
+    ALIAS: str = "crt"
 
     # Primary keys and foreign keys
-    ID = "transactiontocompreltypeid"
+    ID: str = "transactiontocompreltypeid"
 
     # Status fields
-    NAME = "transactiontocompanyreltype"
+    NAME: str = "transactiontocompanyreltype"
 
     # Join condition
     JOIN_CONDITION = "crt.transactiontocompreltypeid = {parent_alias}.{foreign_key}"
 
 
-class TransactionToCompanyRelSchema:
+TransactionToCompRelTypeSchema = TransactionToCompRelTypeSchema()
+
+
+class TransactionToCompanyRelSchema(NamedTuple):
     """Constants for the ciqTransactionToCompanyRel table."""
-    TABLE = "ciqTransactionToCompanyRel"
-    ALIAS = "cr"
+    TABLE: str = "ciqTransactionToCompanyRel"
+    ALIAS: str = "cr"
 
     # Primary keys and foreign keys
-    ID = "transactiontocompanyrelid"
+    ID: str = "transactiontocompanyrelid"
 
     # Status fields
-    REL_TYPE_ID = "transactiontocompreltypeid"
+    REL_TYPE_ID: str = "transactiontocompreltypeid"
 
     # ID fields
-    TRANSACTION_ID = "transactionid"
-    COMPANY_REL_ID = "companyrelid"
+    TRANSACTION_ID: str = "transactionid"
+    COMPANY_REL_ID: str = "companyrelid"
 
     # Flag fields
-    LEAD_INVESTOR_FLAG = "leadinvestorflag"
+    LEAD_INVESTOR_FLAG: str = "leadinvestorflag"
 
     # Other fields
-    CURRENT_INVESTMENT = "currentinvestment"
-    INDIVIDUAL_EQUITY = "individualequity"
-    PERCENT_ACQUIRED = "percentacquired"
+    CURRENT_INVESTMENT: str = "currentinvestment"
+    INDIVIDUAL_EQUITY: str = "individualequity"
+    PERCENT_ACQUIRED: str = "percentacquired"
 
     # Join condition
     JOIN_CONDITION = "cr.transactiontocompanyrelid = {parent_alias}.{foreign_key}"
 
 
-class TransactionTypeSchema:
+TransactionToCompanyRelSchema = TransactionToCompanyRelSchema()
+
+
+class TransactionTypeSchema(NamedTuple):
     """Constants for the ciqTransactionType table."""
-    TABLE = "ciqTransactionType"
-    ALIAS = "tt"
+    TABLE: str = "ciqTransactionType"
+    ALIAS: str = "tt"
 
     # Primary keys and foreign keys
-    ID = "transactionidtypeid"
+    ID: str = "transactionidtypeid"
 
     # Status fields
-    NAME = "transactionidtypename"
+    NAME: str = "transactionidtypename"
 
     # Join condition
-    JOIN_CONDITION = "tt.transactionidtypeid = {parent_alias}.{foreign_key}"
\ No newline at end of file
+    JOIN_CONDITION = "tt.transactionidtypeid = {parent_alias}.{foreign_key}"
+
+
+TransactionTypeSchema = TransactionTypeSchema()
@@ -0,0 +1,109 @@
+"""Test configuration.
+
+Some modules the application imports (settings, the query builder, request
+models and dependencies, the Snowflake connector) are not part of this tree.
+Stand-ins are registered in sys.modules for any that can't be imported, so
+the services and routes can be imported and tested on their own; real
+modules are always preferred when they are available.
+"""
+import importlib
+import sys
+from types import ModuleType, SimpleNamespace
+
+
+def _importable(name):
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _register(name, **attrs):
+    """Register a stand-in module (and any missing parent packages) under name."""
+    parts = name.split(".")
+    for i in range(1, len(parts)):
+        package = ".".join(parts[:i])
+        if package not in sys.modules and not _importable(package):
+            module = ModuleType(package)
+            module.__path__ = []
+            sys.modules[package] = module
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def _stub(name, **attrs):
+    if not _importable(name):
+        _register(name, **attrs)
+
+
+def _alias(name, target):
+    """Make name import the module at target."""
+    if not _importable(name):
+        module = importlib.import_module(target)
+        _register(name)
+        sys.modules[name] = module
+        parent, _, child = name.rpartition(".")
+        setattr(sys.modules[parent], child, module)
+
+
+class _SnowflakeError(Exception):
+    pass
+
+
+class _InterfaceError(_SnowflakeError):
+    pass
+
+
+class _OperationalError(_SnowflakeError):
+    pass
+
+
+def _not_connected(**kwargs):
+    raise _OperationalError("No Snowflake connection in tests")
+
+
+class _QueryBuilder:
+    """Placeholder; tests replace the service's builder functions."""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+
+async def _no_dependency():
+    return None
+
+
+_stub("snowflake.connector", DictCursor=object, SnowflakeConnection=object, connect=_not_connected)
+_stub("snowflake.connector.errors", InterfaceError=_InterfaceError, OperationalError=_OperationalError)
+
+_stub("app.config.settings", settings=SimpleNamespace(
+    API_PREFIX="/api/v1",
+    DEFAULT_LIMIT=100,
+    MAX_LIMIT=1000,
+    SNOWFLAKE_ACCOUNT="test",
+    SNOWFLAKE_USER="test",
+    SNOWFLAKE_PASSWORD="test",
+    SNOWFLAKE_DATABASE="TEST",
+    SNOWFLAKE_SCHEMA="TEST",
+    SNOWFLAKE_WAREHOUSE="TEST",
+))
+_stub("app.query_builder.builder", FlexibleQueryBuilder=_QueryBuilder)
+_stub("app.models", PaginationParams=SimpleNamespace)
+_stub(
+    "app.api.dependencies",
+    get_pagination_params=_no_dependency,
+    get_api_key=_no_dependency,
+    get_schema_info=_no_dependency,
+    validate_field_mappings=_no_dependency,
+)
+
+_alias("app.utils.id_name_mapper", "app.api.routes.id_name_mapper")
+_alias("app.utils.transaction_examples", "app.api.routes.transaction_examples")
+_alias("app.controllers.transaction_controller", "app.api.controllers.transaction_controller")
+_alias("app.query_builder.controllers.transaction_controller", "app.api.controllers.transaction_controller")
@@ -0,0 +1,43 @@
+"""Tests for the encoding of name-mapping transaction route responses."""
+import json
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("msgspec")
+
+from app.api.routes import tr13
+
+ROWS = [{"transactionId": 1, "transactionsize": Decimal("1250.50"), "total": Decimal("3"), "comments": None}]
+QUERY_PARAMETERS = {"year": "2020", "size": Decimal("10.5")}
+
+
+def _payload(response):
+    body = json.loads(response.body)
+    del body["timestamp"]
+    return body
+
+
+def test_msgspec_output_matches_orjson_fallback(monkeypatch):
+    encoded = _payload(tr13._respond(ROWS, QUERY_PARAMETERS))
+
+    monkeypatch.setattr(tr13, "MSGSPEC_AVAILABLE", False)
+    fallback = _payload(tr13._respond(ROWS, QUERY_PARAMETERS))
+
+    assert encoded == fallback
+    assert encoded["data"][0]["transactionsize"] == 1250.5
+    assert encoded["data"][0]["total"] == 3
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate", True),
+    ("br, gzip;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip;q=0, *", False),
+    ("*", True),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip_honours_q_values(header, expected):
+    assert tr13._accepts_gzip(header) is expected
@@ -0,0 +1,86 @@
+"""Tests for the transaction API routes."""
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import transactions
+from app.config.settings import settings
+
+# A row as Snowflake returns it: scaled NUMBER columns and aggregates are Decimal
+DECIMAL_ROW = {"transactionId": 1, "transactionsize": Decimal("1250.50"), "total": Decimal("3")}
+EXPECTED_ROW = {"transactionId": 1, "transactionsize": 1250.5, "total": 3}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    controller = transactions.TransactionController
+
+    async def paginated(params, page, page_size, columnar=False):
+        return {"data": [DECIMAL_ROW], "page": page}
+
+    async def cursor_page(params, cursor, page_size, columnar=False):
+        return {"data": [DECIMAL_ROW], "next_cursor": None}
+
+    async def analyze(params, analysis_type, fields):
+        return {"data": [DECIMAL_ROW], "analysis_type": analysis_type}
+
+    async def rows(params, columnar=False):
+        return [DECIMAL_ROW]
+
+    async def stream(params):
+        yield [DECIMAL_ROW]
+        yield [DECIMAL_ROW]
+
+    monkeypatch.setattr(controller, "get_transactions_with_pagination", staticmethod(paginated))
+    monkeypatch.setattr(controller, "get_transactions_with_cursor", staticmethod(cursor_page))
+    monkeypatch.setattr(controller, "analyze_transactions", staticmethod(analyze))
+    monkeypatch.setattr(controller, "get_transactions", staticmethod(rows))
+    monkeypatch.setattr(controller, "stream_transactions", staticmethod(stream))
+
+    app = FastAPI()
+    app.include_router(transactions.router)
+    app.dependency_overrides[transactions.get_pagination_params] = lambda: SimpleNamespace(page=1, page_size=10)
+    app.dependency_overrides[transactions.get_api_key] = lambda: {"key": "test"}
+    return TestClient(app)
+
+
+def test_json_default_encodes_decimal_like_jsonable_encoder():
+    from app.api.responses import json_default
+
+    assert json_default(Decimal("3")) == 3
+    assert isinstance(json_default(Decimal("3")), int)
+    assert json_default(Decimal("1250.50")) == 1250.5
+    with pytest.raises(TypeError):
+        json_default(object())
+
+
+@pytest.mark.parametrize("method, path", [
+    ("get", "/transactions"),
+    ("get", "/transactions?cursor="),
+    ("post", "/transactions/analyze?analysis_type=trend"),
+])
+def test_decimal_rows_are_encoded(client, method, path):
+    response = getattr(client, method)(settings.API_PREFIX + path)
+
+    assert response.status_code == 200
+    assert response.json()["data"] == [EXPECTED_ROW]
+
+
+def test_protected_endpoint_encodes_decimal_rows(client):
+    response = client.get(settings.API_PREFIX + "/transactions/protected")
+
+    assert response.status_code == 200
+    assert response.json() == [EXPECTED_ROW]
+
+
+def test_stream_encodes_decimal_rows(client):
+    response = client.get(settings.API_PREFIX + "/transactions/stream")
+
+    assert response.status_code == 200
+    assert response.json() == {"data": [EXPECTED_ROW, EXPECTED_ROW], "count": 2}
@@ -0,0 +1,74 @@
+"""Tests for the transaction service's statement plans."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import transaction_service
+from app.utils.errors import QueryBuildError
+
+NUMERIC_FIELDS = {"companyId", "year"}
+
+
+def _fake_build_plan(params, count, required_joins):
+    """Render filters the way the builder does: comma lists as IN, else equality.
+
+    Numeric fields reject non-integer values; other values are quoted.
+    """
+    conditions = []
+    for key, value in params.items():
+        if "," in value:
+            conditions.append(f"{key} IN ({', '.join(value.split(','))})")
+        elif key in NUMERIC_FIELDS:
+            if not value.lstrip("-").isdigit():
+                raise QueryBuildError(f"Invalid numeric value for {key}: {value}")
+            conditions.append(f"{key} = {value}")
+        else:
+            conditions.append(f"{key} = '{value}'")
+    return "SELECT * FROM tr WHERE " + " AND ".join(conditions), SimpleNamespace()
+
+
+@pytest.fixture(autouse=True)
+def fake_builder(monkeypatch):
+    monkeypatch.setattr(transaction_service, "_build_plan", _fake_build_plan)
+    monkeypatch.setattr(
+        transaction_service, "_plan_from_builder",
+        lambda sql_query, query_builder, binds: transaction_service.PreparedPlan(sql_query, binds, (), (), ())
+    )
+    transaction_service.invalidate_plans()
+    yield
+    transaction_service.invalidate_plans()
+
+
+def test_single_values_are_bound():
+    plan = transaction_service.prepare_plan({"companyId": "12,13", "year": "2020"})
+
+    assert plan.sql == "SELECT * FROM tr WHERE companyId IN (12, 13) AND year = :1"
+    assert plan.binds == ("2020",)
+
+
+def test_literal_matching_bind_sentinel_is_not_rewritten():
+    # A literal equal to the first sentinel must not become a placeholder
+    plan = transaction_service.prepare_plan({"companyId": "7310577000,1", "year": "2020"})
+
+    assert plan.binds is None
+    assert plan.sql == "SELECT * FROM tr WHERE companyId IN (7310577000, 1) AND year = 2020"
+
+
+def test_structural_value_matching_bind_sentinel_is_not_rewritten():
+    plan = transaction_service.prepare_plan({"limit": "7310577000", "year": "2020"})
+
+    assert plan.binds is None
+    assert ":1" not in plan.sql
+
+
+def test_text_values_are_bound_for_text_fields():
+    plan = transaction_service.prepare_plan({"status": "closed", "year": "2020"})
+
+    assert plan.sql == "SELECT * FROM tr WHERE status = :1 AND year = :2"
+    assert plan.binds == ("closed", "2020")
+
+
+def test_text_value_for_numeric_field_is_rejected_by_builder():
+    # Binding "abc" against a numeric column would fail in the database instead
+    with pytest.raises(QueryBuildError):
+        transaction_service.prepare_plan({"year": "abc"})